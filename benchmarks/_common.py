@@ -0,0 +1,35 @@
+"""Helpers shared by the benchmark scripts."""
+
+import math
+import os
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def best_of(stmt, number: int, repeat: int = 5) -> float:
+    """Best wall time in seconds for `number` calls of `stmt`."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat))
+
+
+def sample_ns(fn, repeat: int, warmup: int = 0) -> list:
+    """Call `fn` `warmup` times untimed, then return `repeat` timings in ns."""
+    for _ in range(warmup):
+        fn()
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(repeat):
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+    return samples
+
+
+def percentile(samples, q: float) -> int:
+    """Nearest-rank percentile (0 < q <= 100) of a non-empty sample list."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
@@ -0,0 +1,36 @@
+"""set vs. bitset.BitSet for small-alphabet set algebra.
+
+Run with: python benchmarks/bench_bitset.py
+"""
+
+import random
+import string
+import sys
+
+from _common import best_of
+from learn_python.bitset import ASCII_LETTERS
+
+
+def main(count: int = 10_000) -> None:
+    words = ["".join(random.choices(string.ascii_lowercase, k=12)) for _ in range(count)]
+    sets = [set(w) for w in words]
+    bitsets = [ASCII_LETTERS.from_string(w) for w in words]
+    pairs = list(zip(sets, sets[1:]))
+    bit_pairs = list(zip(bitsets, bitsets[1:]))
+
+    def algebra(items):
+        return [(a - b, a | b, a & b, a ^ b) for a, b in items]
+
+    set_time = best_of(lambda: algebra(pairs), 1)
+    bit_time = best_of(lambda: algebra(bit_pairs), 1)
+    print(f"- | & ^ on {count:,} pairs: set {set_time * 1e3:.2f} ms, "
+          f"BitSet {bit_time * 1e3:.2f} ms ({set_time / bit_time:.1f}x)")
+
+    set_size = sum(sys.getsizeof(s) for s in sets) / count
+    bit_size = sum(sys.getsizeof(b) + sys.getsizeof(b.bits) for b in bitsets) / count
+    print(f"bytes per set: set {set_size:.0f}, BitSet {bit_size:.0f} "
+          f"({set_size / bit_size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
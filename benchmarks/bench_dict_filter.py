@@ -0,0 +1,65 @@
+"""Filtering a big dict: the two strategies from control_flow.py vs. dict_filter.
+
+Reports wall time and the peak extra memory (tracemalloc) of each strategy.
+
+Run with: python benchmarks/bench_dict_filter.py [size]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import _common  # noqa: F401  (puts the repo root on sys.path)
+from learn_python.dict_filter import SnapshotDict, filter_in_place
+
+
+def iterate_over_copy(users):
+    for user, status in users.copy().items():
+        if status == "inactive":
+            del users[user]
+    return users
+
+
+def create_new_collection(users):
+    active_users = {}
+    for user, status in users.items():
+        if status == "active":
+            active_users[user] = status
+    return active_users
+
+
+def in_place(users):
+    filter_in_place(users, lambda user, status: status == "active")
+    return users
+
+
+def snapshot_dict(users):
+    users.filter_in_place(lambda user, status: status == "active")
+    return users
+
+
+# name -> (table type, strategy); the table is built before measuring starts.
+STRATEGIES = {
+    "users.copy() + del": (dict, iterate_over_copy),
+    "new active_users dict": (dict, create_new_collection),
+    "filter_in_place": (dict, in_place),
+    "SnapshotDict.filter_in_place": (SnapshotDict, snapshot_dict),
+}
+
+
+def main(size: int = 1_000_000) -> None:
+    print(f"{size:,} sessions, 10% inactive")
+    for name, (table, strategy) in STRATEGIES.items():
+        users = table((f"user{i}", "inactive" if i % 10 == 0 else "active")
+                      for i in range(size))
+        tracemalloc.start()
+        start = time.perf_counter()
+        strategy(users)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<30} {elapsed * 1e3:8.1f} ms   peak extra {peak / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
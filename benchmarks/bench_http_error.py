@@ -0,0 +1,35 @@
+"""http_error() via `match` vs. the classify_statuses() lookup table.
+
+Run with: python benchmarks/bench_http_error.py
+"""
+
+import random
+
+from _common import best_of
+from learn_python import control_flow
+
+
+def main() -> None:
+    statuses = [random.choice((200, 301, 400, 401, 403, 404, 418, 500, 503))
+                for _ in range(100_000)]
+    http_error = control_flow.http_error
+    assert control_flow.classify_statuses(statuses) == [http_error(s) for s in statuses]
+
+    match_time = best_of(lambda: [http_error(s) for s in statuses], number=10)
+    table_time = best_of(lambda: control_flow.classify_statuses(statuses), number=10)
+    print(f"match             {match_time * 1e3:8.2f} ms / 1M statuses")
+    print(f"classify_statuses {table_time * 1e3:8.2f} ms / 1M statuses "
+          f"({match_time / table_time:.1f}x)")
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    array = np.array(statuses, dtype=np.int64)
+    numpy_time = best_of(lambda: control_flow.classify_statuses(array), number=10)
+    print(f"numpy codes       {numpy_time * 1e3:8.2f} ms / 1M statuses "
+          f"({match_time / numpy_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
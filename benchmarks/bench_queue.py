@@ -0,0 +1,77 @@
+"""Dequeue throughput of list, deque, queue.Queue and WorkQueue as depth grows.
+
+At each depth the queue is filled, then timed over steady-state
+enqueue/dequeue pairs, so the numbers show the per-operation cost at that
+backlog. list.pop(0) is O(depth) and falls off a cliff; the others stay flat.
+
+Run with: python benchmarks/bench_queue.py [max_depth]
+"""
+
+import queue
+import sys
+import time
+from collections import deque
+
+import _common  # noqa: F401  (puts the repo root on sys.path)
+from learn_python.work_queue import ThreadSafeWorkQueue, WorkQueue
+
+OPS = 2_000  # enqueue/dequeue pairs timed per depth
+
+
+def _list_queue(depth):
+    items = list(range(depth))
+    return items.append, lambda: items.pop(0)
+
+
+def _deque_queue(depth):
+    items = deque(range(depth))
+    return items.append, items.popleft
+
+
+def _stdlib_queue(depth):
+    items = queue.Queue()
+    for i in range(depth):
+        items.put_nowait(i)
+    return items.put_nowait, items.get_nowait
+
+
+def _work_queue(depth):
+    items = WorkQueue()
+    items.put_many(range(depth))
+    return items.put, items.get
+
+
+def _thread_safe_work_queue(depth):
+    items = ThreadSafeWorkQueue()
+    items.put_many(range(depth))
+    return items.put, items.get
+
+
+QUEUES = {
+    "list.pop(0)": _list_queue,
+    "deque": _deque_queue,
+    "queue.Queue": _stdlib_queue,
+    "WorkQueue": _work_queue,
+    "ThreadSafeWorkQueue": _thread_safe_work_queue,
+}
+
+
+def main(max_depth: int = 10**7) -> None:
+    depths = [10**k for k in range(3, len(str(max_depth)))]
+    print(f"{'depth':>10}" + "".join(f"{name:>22}" for name in QUEUES))
+    for depth in depths:
+        row = f"{depth:>10}"
+        for make in QUEUES.values():
+            put, get = make(depth)
+            start = time.perf_counter()
+            for i in range(OPS):
+                put(i)
+                get()
+            ops_per_sec = OPS / (time.perf_counter() - start)
+            row += f"{ops_per_sec:>18,.0f}/s  "
+            del put, get
+        print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
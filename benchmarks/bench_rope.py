@@ -0,0 +1,55 @@
+"""Splicing a large text: str slicing + concat vs. rope.Rope.
+
+Each round replaces a random span of the document with a short string,
+keeping the result for the next round, i.e. the editing loop a document
+store runs.
+
+Run with: python benchmarks/bench_rope.py [megabytes]
+"""
+
+import random
+import statistics
+import sys
+
+from _common import percentile, sample_ns
+from learn_python.rope import Rope
+
+ROUNDS = 2_000
+STR_ROUNDS = 5  # every str splice copies the whole document
+
+
+def main(megabytes: int = 100) -> None:
+    text = "lorem ipsum dolor sit amet, " * (megabytes * 2**20 // 28)
+    rng = random.Random(0)
+    doc = {"str": text, "rope": Rope(text), "slices": Rope(text)}
+
+    def edit(kind):
+        def run():
+            current = doc[kind]
+            i = rng.randrange(len(current))
+            j = min(len(current), i + rng.randrange(64))
+            if kind == "str":
+                doc[kind] = current[:i] + "spliced" + current[j:]
+            elif kind == "rope":
+                doc[kind] = current.splice(i, j, "spliced")
+            else:
+                doc[kind] = current[:i] + "spliced" + current[j:]
+        return run
+
+    print(f"{len(text) / 2**20:.0f} MB document")
+    print(f"{'method':<28}{'rounds':>8}{'median':>14}{'p99':>14}")
+    for label, kind, rounds in (("str[:i] + s + str[j:]", "str", STR_ROUNDS),
+                                ("Rope.splice(i, j, s)", "rope", ROUNDS),
+                                ("rope[:i] + s + rope[j:]", "slices", ROUNDS)):
+        samples = sample_ns(edit(kind), rounds, warmup=1)
+        print(f"{label:<28}{rounds:>8}{statistics.median(samples) / 1e3:>11.1f} µs"
+              f"{percentile(samples, 99) / 1e3:>11.1f} µs", flush=True)
+    rope = doc["rope"]
+    print(f"rope after {ROUNDS} edits: depth {rope.depth}, "
+          f"{sum(1 for _ in rope.chunks())} leaves")
+    flatten_ns, = sample_ns(lambda: str(rope), 1)
+    print(f"{'str(rope) (flatten once)':<28}{1:>8}{flatten_ns / 1e3:>11.1f} µs")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
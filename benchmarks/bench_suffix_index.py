@@ -0,0 +1,68 @@
+"""Repeated substring queries: str scans vs. suffix_index.SuffixIndex.
+
+Builds an index over a generated text, saves it, maps it back in, and
+times `in`, count() and find_all() against `in`, str.count() and a
+str.find() loop over the same patterns.
+
+Run with: python benchmarks/bench_suffix_index.py [kilochars]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from _common import best_of
+from learn_python.suffix_index import SuffixIndex
+
+QUERIES = 1_000
+
+
+def _find_all(text, pattern):
+    positions = []
+    i = text.find(pattern)
+    while i >= 0:
+        positions.append(i)
+        i = text.find(pattern, i + 1)
+    return positions
+
+
+def main(kilochars: int = 200) -> None:
+    rng = random.Random(0)
+    words = ["".join(rng.choice("etaoinshrdlu") for _ in range(rng.randint(2, 9)))
+             for _ in range(5_000)]
+    text = " ".join(rng.choice(words) for _ in range(kilochars * 200))[:kilochars * 1000]
+    patterns = [text[i:i + rng.randint(3, 12)]
+                for i in (rng.randrange(len(text)) for _ in range(QUERIES))]
+
+    start = time.perf_counter()
+    index = SuffixIndex(text)
+    print(f"build   {len(text):,} chars: {time.perf_counter() - start:.2f} s")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "text.sfx")
+        index.save(path)
+        start = time.perf_counter()
+        loaded = SuffixIndex.load(path)
+        print(f"load    {os.path.getsize(path):,} bytes: "
+              f"{(time.perf_counter() - start) * 1e3:.3f} ms (mmap)")
+
+        print(f"{QUERIES} queries{'str':>20}{'index':>14}{'mmap index':>14}")
+        rows = (
+            ("in", lambda: [p in text for p in patterns],
+             lambda ix: [p in ix for p in patterns]),
+            ("count", lambda: [text.count(p) for p in patterns],
+             lambda ix: [ix.count(p) for p in patterns]),
+            ("find_all", lambda: [_find_all(text, p) for p in patterns],
+             lambda ix: [ix.find_all(p) for p in patterns]),
+        )
+        for name, scan, query in rows:
+            timings = (best_of(scan, 1, 3), best_of(lambda: query(index), 1, 3),
+                       best_of(lambda: query(loaded), 1, 3))
+            print(f"{name:<16}" + "".join(f"{t * 1e3:>11.1f} ms" for t in timings),
+                  flush=True)
+        loaded.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
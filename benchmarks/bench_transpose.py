@@ -0,0 +1,42 @@
+"""Matrix transpose: nested comprehension and zip vs. matrix.Matrix.
+
+Run with: python benchmarks/bench_transpose.py [size ...]
+"""
+
+import sys
+
+from _common import best_of
+from learn_python import _optional
+from learn_python.matrix import Matrix
+
+
+def main(sizes=(100, 500, 1000, 2000)) -> None:
+    methods = ["comprehension", "zip", "Matrix.T (view)", "Matrix.transpose (tiled)"]
+    numpy = _optional.numpy()
+    if numpy is not None:
+        methods.append("Matrix.transpose (numpy)")
+    print(f"{'size':>6}" + "".join(f"{name:>26}" for name in methods))
+    for n in sizes:
+        rows = [[float(i * n + j) for j in range(n)] for i in range(n)]
+        m = Matrix.from_rows(rows)
+
+        def tiled():
+            _optional.use_numpy = False
+            try:
+                return m.transpose()
+            finally:
+                _optional.use_numpy = True
+
+        timings = [
+            best_of(lambda: [[row[i] for row in rows] for i in range(n)], 1, 3),
+            best_of(lambda: list(zip(*rows)), 1, 3),
+            best_of(lambda: m.T, 1, 3),
+            best_of(tiled, 1, 3),
+        ]
+        if numpy is not None:
+            timings.append(best_of(m.transpose, 1, 3))
+        print(f"{n:>6}" + "".join(f"{t * 1e3:>23.2f} ms" for t in timings), flush=True)
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (100, 500, 1000, 2000))
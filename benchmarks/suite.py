@@ -0,0 +1,319 @@
+"""Benchmark suite for the hot functions, with regression tracking.
+
+Every case runs over a parameter sweep. Each point gets untimed warmup
+calls and then `repeat` individually timed calls (time.perf_counter_ns).
+The median and p99 are reported. Results go to a JSON file keyed by git
+commit, so runs from different commits sit side by side. The run is then
+compared against a stored baseline (--baseline, or benchmarks/baseline.json
+when it exists) and exits 1 when any case's median (or --metric p99) got
+slower by more than --max-regression. Both files are per machine and are
+not committed.
+
+Run with:
+    python benchmarks/suite.py                        # full sweep
+    python benchmarks/suite.py --quick -k pattern     # smaller, filtered
+    python benchmarks/suite.py --save-baseline        # store this run as the baseline
+    python benchmarks/suite.py --max-regression 0.2   # compare against it
+    python benchmarks/suite.py --no-baseline          # just measure
+
+Only the standard library is needed: the optional NumPy fast paths are
+switched off while the suite runs, so numbers compare across machines.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import deque, namedtuple
+
+from _common import ROOT, percentile, sample_ns
+from learn_python import _optional, control_flow, pattern, points, primes, sinks
+from learn_python.matrix import Matrix
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS = os.path.join(HERE, "results.json")
+BASELINE = os.path.join(HERE, "baseline.json")
+
+# `setup(value)` builds the inputs outside the timed region and returns the
+# zero-argument callable that gets timed.
+Case = namedtuple("Case", ["name", "param", "sweep", "setup"])
+
+
+class _NullWriter(io.TextIOBase):
+    """Text file that throws everything away, so output cost is only formatting."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+_NULL = _NullWriter()
+
+
+########################
+## Cases
+########################
+
+def _nForest(n):
+    # No cache argument: every row is rendered on every call.
+    return lambda: pattern.write_nForest(n, file=_NULL)
+
+
+def _printC(n):
+    return lambda: pattern.write_printC(n, file=_NULL)
+
+
+def _prime_loop(limit):
+    # The loop/else prime check from control_flow.loop_else(), minus the prints.
+    def run():
+        found = []
+        for n in range(2, limit):
+            for x in range(2, n):
+                if n % x == 0:
+                    break
+            else:
+                found.append(n)
+        return found
+    return run
+
+
+def _iter_primes(limit):
+    return lambda: sum(1 for _ in primes.iter_primes(2, limit))
+
+
+def _statuses(count):
+    rng = random.Random(count)
+    return [rng.choice((200, 301, 400, 401, 403, 404, 418, 500, 503))
+            for _ in range(count)]
+
+
+def _http_error(count):
+    statuses = _statuses(count)
+    http_error = control_flow.http_error
+    return lambda: [http_error(s) for s in statuses]
+
+
+def _classify_statuses(count):
+    statuses = _statuses(count)
+    return lambda: control_flow.classify_statuses(statuses)
+
+
+def _coords(count):
+    rng = random.Random(count)
+    return [(rng.choice((0, rng.random())), rng.choice((0, rng.random())))
+            for _ in range(count)]
+
+
+def _where_is(count):
+    pts = [control_flow.Point(x, y) for x, y in _coords(count)]
+    where_is = control_flow.where_is
+
+    def run():
+        for p in pts:
+            where_is(p)
+    return run
+
+
+def _where_is_bulk(count):
+    array = points.PointArray(*zip(*_coords(count)))
+    return lambda: points.where_is_bulk(array)
+
+
+def _list_queue(depth):
+    items = list(range(depth))
+
+    def run():
+        for i in range(1000):
+            items.append(i)
+            items.pop(0)
+    return run
+
+
+def _deque_queue(depth):
+    items = deque(range(depth))
+
+    def run():
+        for i in range(1000):
+            items.append(i)
+            items.popleft()
+    return run
+
+
+def _rows(n):
+    return [[float(i * n + j) for j in range(n)] for i in range(n)]
+
+
+def _transpose_comprehension(n):
+    rows = _rows(n)
+    return lambda: [[row[i] for row in rows] for i in range(n)]
+
+
+def _transpose_zip(n):
+    rows = _rows(n)
+    return lambda: list(zip(*rows))
+
+
+def _transpose_matrix(n):
+    return Matrix.from_rows(_rows(n)).transpose
+
+
+CASES = (
+    Case("pattern.nForest", "n", (10, 100, 1000), _nForest),
+    Case("pattern.printC", "n", (9, 100, 500), _printC),
+    Case("primes.loop_else", "limit", (100, 1000, 5000), _prime_loop),
+    Case("primes.iter_primes", "limit", (1000, 100_000, 1_000_000), _iter_primes),
+    Case("control_flow.http_error", "count", (1000, 100_000), _http_error),
+    Case("control_flow.classify_statuses", "count", (1000, 100_000), _classify_statuses),
+    Case("control_flow.where_is", "count", (1000, 10_000), _where_is),
+    Case("points.where_is_bulk", "count", (1000, 10_000), _where_is_bulk),
+    Case("queue.list_pop0", "depth", (1000, 100_000), _list_queue),
+    Case("queue.deque_popleft", "depth", (1000, 100_000), _deque_queue),
+    Case("transpose.comprehension", "n", (64, 256, 512), _transpose_comprehension),
+    Case("transpose.zip", "n", (64, 256, 512), _transpose_zip),
+    Case("transpose.matrix", "n", (64, 256, 512), _transpose_matrix),
+)
+
+
+########################
+## Running and comparing
+########################
+
+def git_commit() -> str:
+    """HEAD's sha, with a "-dirty" suffix for uncommitted changes."""
+    def git(*args):
+        return subprocess.run(("git", *args), cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    try:
+        sha = git("rev-parse", "HEAD")
+        dirty = git("status", "--porcelain", "--untracked-files=no")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return sha + ("-dirty" if dirty else "")
+
+
+def run_suite(cases=CASES, warmup: int = 3, repeat: int = 30, quick: bool = False,
+              log=None) -> dict:
+    """Time every sweep point of `cases` and return {key: stats}."""
+    results = {}
+    previous = sinks.set_sink(sinks.StreamSink(_NULL))  # where_is() emits
+    _optional.use_numpy = False  # time the pure-Python paths
+    try:
+        for case in cases:
+            sweep = case.sweep[:2] if quick else case.sweep
+            for value in sweep:
+                key = f"{case.name}[{case.param}={value}]"
+                samples = sample_ns(case.setup(value), repeat, warmup)
+                results[key] = {
+                    "median_ns": int(statistics.median(samples)),
+                    "p99_ns": percentile(samples, 99),
+                    "min_ns": min(samples),
+                    "repeat": repeat,
+                }
+                if log is not None:
+                    log(f"{key:<50}{results[key]['median_ns'] / 1e6:>12.3f} ms"
+                        f"{results[key]['p99_ns'] / 1e6:>12.3f} ms")
+    finally:
+        sinks.set_sink(previous)
+        _optional.use_numpy = True
+    return results
+
+
+def compare(current: dict, baseline: dict, max_regression: float,
+            metric: str = "median_ns") -> list:
+    """Return (key, baseline, current, ratio) for every case over the limit."""
+    regressions = []
+    for key, stats in current.items():
+        if key not in baseline:
+            continue
+        before, after = baseline[key][metric], stats[metric]
+        ratio = after / before if before else float("inf")
+        if ratio > 1 + max_regression:
+            regressions.append((key, before, after, ratio))
+    return regressions
+
+
+def _load(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save(path: str, data: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="filter", default="",
+                        help="only run cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true",
+                        help="first two sweep points only")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--output", default=RESULTS,
+                        help="JSON file of runs keyed by git commit (default: %(default)s)")
+    parser.add_argument("--baseline", default=None,
+                        help="stored run to compare against; regressions exit 1 "
+                             "(default: benchmarks/baseline.json when it exists)")
+    parser.add_argument("--no-baseline", action="store_true",
+                        help="don't compare against any baseline")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE, default=None,
+                        metavar="PATH", help="also store this run as a baseline")
+    parser.add_argument("--max-regression", type=float, default=0.10,
+                        help="allowed slowdown as a fraction (default: %(default)s)")
+    parser.add_argument("--metric", choices=("median", "p99"), default="median")
+    args = parser.parse_args(argv)
+    if args.baseline is None and not args.no_baseline and os.path.exists(BASELINE):
+        args.baseline = BASELINE
+    # Read it before this run can overwrite it with --save-baseline.
+    baseline = None if args.no_baseline or args.baseline is None else _load(args.baseline)
+
+    cases = [case for case in CASES if args.filter in case.name]
+    print(f"{'case':<50}{'median':>15}{'p99':>15}")
+    run = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "results": run_suite(cases, args.warmup, args.repeat, args.quick,
+                             log=lambda line: print(line, flush=True)),
+    }
+
+    runs = _load(args.output)
+    runs[run["commit"]] = run
+    _save(args.output, runs)
+    if args.save_baseline:
+        _save(args.save_baseline, run)
+
+    if baseline is None:
+        return 0
+    if not baseline:
+        print(f"no baseline at {args.baseline}", file=sys.stderr)
+        return 2
+    regressions = compare(run["results"], baseline["results"],
+                          args.max_regression, f"{args.metric}_ns")
+    for key, before, after, ratio in regressions:
+        print(f"REGRESSION {key}: {before / 1e6:.3f} ms -> {after / 1e6:.3f} ms "
+              f"({ratio - 1:+.0%}, baseline {baseline.get('commit', '?')[:12]})",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
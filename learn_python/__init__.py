@@ -0,0 +1,126 @@
+"""Python tutorial notes plus the reusable helpers grown out of them.
+
+Importing the package is cheap: nothing below is imported until first use,
+and no tutorial module prints or asks for input on import. The examples run
+only through the runner::
+
+    python -m learn_python                 # every tutorial, in order
+    python -m learn_python control_flow    # just one
+
+Names re-exported here resolve lazily through module ``__getattr__``, so
+``from learn_python import nForest`` imports ``learn_python.pattern`` and
+nothing else.
+"""
+
+import importlib
+
+# Tutorial notes, in reading order. Each has a run() that plays its examples.
+TUTORIALS = ("basics", "control_flow", "data_structure", "pattern")
+
+_SUBMODULES = frozenset(TUTORIALS + (
+    "adder", "bitset", "dict_filter", "instrument", "latency", "matrix",
+    "memoize", "phone_book", "points", "primes", "rope", "router",
+    "sensor_stats", "sinks", "sorted_collection", "suffix_index", "work_queue",
+))
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    # control_flow (its printing add() stays control_flow.add; the package
+    # level `add` is the summing one from adder)
+    "http_error": "control_flow",
+    "classify_statuses": "control_flow",
+    "HTTP_CATEGORIES": "control_flow",
+    "Point": "control_flow",
+    "where_is": "control_flow",
+    "greet": "control_flow",
+    "demo": "control_flow",
+    "good_func": "control_flow",
+    # pattern
+    "RowCache": "pattern",
+    "row_cache": "pattern",
+    "nForest": "pattern",
+    "iter_nForest": "pattern",
+    "write_nForest": "pattern",
+    "printC": "pattern",
+    "iter_printC": "pattern",
+    "write_printC": "pattern",
+    # adder
+    "add": "adder",
+    "add_iter": "adder",
+    "add_parallel": "adder",
+    # bitset
+    "Universe": "bitset",
+    "BitSet": "bitset",
+    # dict_filter
+    "filter_in_place": "dict_filter",
+    "partition": "dict_filter",
+    "SnapshotDict": "dict_filter",
+    # instrument
+    "instrumented": "instrument",
+    # latency
+    "Histogram": "latency",
+    # matrix
+    "Matrix": "matrix",
+    # memoize
+    "memoize": "memoize",
+    # phone_book
+    "PhoneBook": "phone_book",
+    # points
+    "PointArray": "points",
+    "where_is_bulk": "points",
+    "save_points": "points",
+    "PointFile": "points",
+    "where_is_file": "points",
+    # primes
+    "iter_primes": "primes",
+    "iter_factors": "primes",
+    "factor_report": "primes",
+    "is_prime": "primes",
+    # rope
+    "Rope": "rope",
+    # router
+    "Event": "router",
+    "Router": "router",
+    # sensor_stats
+    "read_chunks": "sensor_stats",
+    "drop_nans": "sensor_stats",
+    "RunningStats": "sensor_stats",
+    "summarize": "sensor_stats",
+    # sinks
+    "Record": "sinks",
+    "Sink": "sinks",
+    "StreamSink": "sinks",
+    "BatchedSink": "sinks",
+    "RingBufferSink": "sinks",
+    "get_sink": "sinks",
+    "set_sink": "sinks",
+    "emit": "sinks",
+    # sorted_collection
+    "SortedList": "sorted_collection",
+    "SortedSet": "sorted_collection",
+    # suffix_index
+    "SuffixIndex": "suffix_index",
+    # work_queue
+    "WorkQueue": "work_queue",
+    "ThreadSafeWorkQueue": "work_queue",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    # Exports first: `memoize` is both a submodule and the decorator in it,
+    # and `from learn_python import memoize` means the decorator.
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        if name in _SUBMODULES:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_EXPORTS))
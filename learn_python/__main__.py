@@ -0,0 +1,27 @@
+"""Run the tutorial examples: ``python -m learn_python [tutorial ...]``."""
+
+import argparse
+import importlib
+
+from . import TUTORIALS
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m learn_python",
+        description="Run the examples of one or more tutorial notes.")
+    # No `choices=` here: with nargs="*" argparse checks the empty default
+    # list against them too and rejects a plain `python -m learn_python`.
+    parser.add_argument("tutorials", nargs="*", metavar="tutorial",
+                        help=f"any of {', '.join(TUTORIALS)} (default: all)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.tutorials if name not in TUTORIALS]
+    if unknown:
+        parser.error(f"unknown tutorial(s): {', '.join(unknown)} "
+                     f"(choose from {', '.join(TUTORIALS)})")
+    for name in args.tutorials or TUTORIALS:
+        importlib.import_module(f"{__package__}.{name}").run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+########################
+# 📌 Optional NumPy, imported on first use
+########################
+
+# Several modules have a NumPy fast path, but NumPy is never required and
+# importing it costs ~100 ms, so no module imports it at the top. A fast path
+# calls numpy() instead: NumPy is imported once, the first time one is taken,
+# and None comes back when it is not installed — then the pure-Python path
+# runs and gives the same result.
+#
+# Setting `use_numpy = False` makes numpy() return None even when NumPy is
+# installed; the benchmarks and tests use it to time and check the
+# pure-Python paths.
+
+use_numpy = True
+
+_numpy = None
+_missing = False
+
+
+def numpy():
+    """The numpy module, or None when it is not installed or switched off."""
+    global _numpy, _missing
+    if not use_numpy or _missing:
+        return None
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _missing = True
+            return None
+        _numpy = numpy
+    return _numpy
@@ -0,0 +1,172 @@
+########################
+# 📌 BitSet: sets over a small fixed universe, stored as one int
+########################
+
+# The set section of data_structure.py does `set('abracadabra') - set('alacazam')`
+# and friends on hashed sets. When every element comes from a small known
+# universe (letters, feature IDs, ...) a set fits in the bits of one Python
+# int: bit i is set when universe element i is in the set. Union,
+# intersection and difference become single |, & and & ~ on that int.
+#
+#     letters = Universe(string.ascii_lowercase)
+#     a = letters.from_string('abracadabra')
+#     b = letters.from_string('alacazam')
+#     a - b                                   # BitSet('bdr')
+#     a.filter(lambda x: x not in 'abc')      # like filtered_set
+
+class Universe:
+    """The fixed, ordered collection of elements a BitSet can hold."""
+
+    def __init__(self, elements):
+        self.elements = tuple(elements)
+        self._masks = {element: 1 << i for i, element in enumerate(self.elements)}
+        if len(self._masks) != len(self.elements):
+            raise ValueError("universe elements must be unique")
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __repr__(self) -> str:
+        return f"Universe({self.elements!r})"
+
+    def mask(self, element) -> int:
+        try:
+            return self._masks[element]
+        except KeyError:
+            raise ValueError(f"{element!r} is not in the universe") from None
+
+    def bitset(self, elements=()) -> "BitSet":
+        bits = 0
+        for element in elements:
+            bits |= self.mask(element)
+        return BitSet(self, bits)
+
+    def from_string(self, text: str) -> "BitSet":
+        # set() dedups in C first, so the Python loop only sees unique chars.
+        return self.bitset(set(text))
+
+    def full(self) -> "BitSet":
+        return BitSet(self, (1 << len(self.elements)) - 1)
+
+
+class BitSet:
+    """Mutable set of Universe elements backed by the bits of an int."""
+
+    __slots__ = ("universe", "bits")
+    __hash__ = None  # mutable, like set
+
+    def __init__(self, universe: Universe, bits: int = 0):
+        self.universe = universe
+        self.bits = bits
+
+    def _other_bits(self, other) -> int:
+        if not isinstance(other, BitSet):
+            raise TypeError(f"expected a BitSet, got {type(other).__name__}")
+        if other.universe is not self.universe:
+            raise ValueError("BitSets come from different universes")
+        return other.bits
+
+    # Set algebra
+    def __or__(self, other):
+        return BitSet(self.universe, self.bits | self._other_bits(other))
+
+    def __and__(self, other):
+        return BitSet(self.universe, self.bits & self._other_bits(other))
+
+    def __sub__(self, other):
+        return BitSet(self.universe, self.bits & ~self._other_bits(other))
+
+    def __xor__(self, other):
+        return BitSet(self.universe, self.bits ^ self._other_bits(other))
+
+    def __ior__(self, other):
+        self.bits |= self._other_bits(other)
+        return self
+
+    def __iand__(self, other):
+        self.bits &= self._other_bits(other)
+        return self
+
+    def __isub__(self, other):
+        self.bits &= ~self._other_bits(other)
+        return self
+
+    def __ixor__(self, other):
+        self.bits ^= self._other_bits(other)
+        return self
+
+    # Comparisons (subset / superset, like set)
+    def __eq__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self.universe is other.universe and self.bits == other.bits
+
+    def __le__(self, other):
+        return self.bits & ~self._other_bits(other) == 0
+
+    def __lt__(self, other):
+        return self <= other and self.bits != other.bits
+
+    def __ge__(self, other):
+        return self._other_bits(other) & ~self.bits == 0
+
+    def __gt__(self, other):
+        return self >= other and self.bits != other.bits
+
+    def isdisjoint(self, other) -> bool:
+        return self.bits & self._other_bits(other) == 0
+
+    # Container protocol
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, element) -> bool:
+        mask = self.universe._masks.get(element)
+        return mask is not None and self.bits & mask != 0
+
+    def __iter__(self):
+        """Elements in universe order."""
+        elements = self.universe.elements
+        bits = self.bits
+        while bits:
+            low = bits & -bits  # lowest set bit
+            yield elements[low.bit_length() - 1]
+            bits ^= low
+
+    def __repr__(self) -> str:
+        items = list(self)
+        if all(isinstance(item, str) and len(item) == 1 for item in items):
+            return f"BitSet({''.join(items)!r})"
+        return f"BitSet({items!r})"
+
+    # Mutation
+    def add(self, element) -> None:
+        self.bits |= self.universe.mask(element)
+
+    def discard(self, element) -> None:
+        self.bits &= ~self.universe._masks.get(element, 0)
+
+    def remove(self, element) -> None:
+        if element not in self:
+            raise KeyError(element)
+        self.discard(element)
+
+    def copy(self) -> "BitSet":
+        return BitSet(self.universe, self.bits)
+
+    def filter(self, predicate) -> "BitSet":
+        """Like `{x for x in self if predicate(x)}`, as a BitSet."""
+        bits = 0
+        masks = self.universe._masks
+        for element in self:
+            if predicate(element):
+                bits |= masks[element]
+        return BitSet(self.universe, bits)
+
+
+# Ready-made universe for the string examples in data_structure.py. Spelled
+# out, because `import string` drags in `re` just for string.ascii_letters.
+ASCII_LETTERS = Universe("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
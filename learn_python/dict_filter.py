@@ -0,0 +1,153 @@
+########################
+# 📌 Filtering dicts without copying them
+########################
+
+# The FOR section of control_flow.py filters `users` either by looping over
+# `users.copy().items()` and deleting, or by building a new `active_users`
+# dict. Both allocate a second table as big as the first. Here:
+#   - filter_in_place() / partition() only remember the keys that go
+#   - SnapshotDict lets readers iterate a stable snapshot while a writer keeps
+#     adding and deleting: changes made during a read go to a small overlay
+#     that is folded back in once the last reader is done, so nothing ever
+#     copies the whole table.
+
+import threading
+
+
+def filter_in_place(mapping: dict, predicate) -> int:
+    """Keep only the items where predicate(key, value) is true.
+
+    Returns how many items were removed. Extra memory is one list of the
+    removed keys, never a copy of the whole dict.
+    """
+    doomed = [key for key, value in mapping.items() if not predicate(key, value)]
+    for key in doomed:
+        del mapping[key]
+    return len(doomed)
+
+
+def partition(mapping: dict, predicate) -> dict:
+    """Move the items where predicate(key, value) is false into a new dict.
+
+    `mapping` keeps the matching items; the returned dict holds the rest.
+    """
+    removed = {key: value for key, value in mapping.items() if not predicate(key, value)}
+    for key in removed:
+        del mapping[key]
+    return removed
+
+
+class SnapshotDict:
+    """Dict whose iterators see a snapshot, while writes carry on alongside.
+
+    While any iterator is open the base table is frozen; writes land in an
+    overlay (`_updated` / `_deleted`) and are merged once the last iterator
+    finishes. Starting an iterator costs O(size of the overlay).
+    """
+
+    def __init__(self, items=()):
+        self._base = dict(items)
+        self._updated = {}
+        self._deleted = set()
+        self._len = len(self._base)
+        self._readers = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._updated:
+                return self._updated[key]
+            if key in self._deleted:
+                raise KeyError(key)
+            return self._base[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._updated or (key not in self._deleted and key in self._base)
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            if not self._readers:
+                if key not in self._base:
+                    self._len += 1
+                self._base[key] = value
+                return
+            if key not in self._updated and (key in self._deleted or key not in self._base):
+                self._len += 1
+            self._deleted.discard(key)
+            self._updated[key] = value
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            if not self._readers:
+                del self._base[key]
+            elif key in self._updated:
+                del self._updated[key]
+                if key in self._base:
+                    self._deleted.add(key)
+            elif key in self._base and key not in self._deleted:
+                self._deleted.add(key)
+            else:
+                raise KeyError(key)
+            self._len -= 1
+
+    def filter_in_place(self, predicate) -> int:
+        """Delete every item where predicate(key, value) is false."""
+        removed = 0
+        for key, value in self.items():
+            if not predicate(key, value):
+                del self[key]
+                removed += 1
+        return removed
+
+    def items(self):
+        """Yield (key, value) pairs as they were when iteration started.
+
+        Exhaust or close() the iterator: an abandoned one keeps the overlay
+        alive until it is garbage collected.
+        """
+        with self._lock:
+            self._readers += 1
+            updated = dict(self._updated)
+            deleted = frozenset(self._deleted)
+        try:
+            for key, value in self._base.items():
+                if key in updated:
+                    yield key, updated.pop(key)
+                elif key not in deleted:
+                    yield key, value
+            yield from updated.items()  # keys that are new since the base
+        finally:
+            with self._lock:
+                self._readers -= 1
+                if not self._readers:
+                    self._merge()
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return (value for _, value in self.items())
+
+    def _merge(self) -> None:
+        # Called with the lock held once no iterator pins the base table.
+        for key in self._deleted:
+            del self._base[key]
+        self._base.update(self._updated)
+        self._deleted.clear()
+        self._updated.clear()
+
+    def __repr__(self) -> str:
+        return f"SnapshotDict({dict(self.items())!r})"
@@ -0,0 +1,160 @@
+########################
+# 📌 Opt-in instrumentation for the hot public functions
+########################
+
+# Functions decorated with @instrumented (the public ones in pattern.py and
+# control_flow.py) get call counts, cumulative time, p50/p99 latency (see
+# latency.py: exact for the first 1024 calls, sampled after that) and,
+# optionally, tracemalloc allocation deltas — but only when the process
+# starts with the environment variable set:
+#
+#     LEARN_PYTHON_INSTRUMENT=1             record calls and latencies
+#     LEARN_PYTHON_INSTRUMENT_ALLOC=1       also trace allocations (slow!)
+#     LEARN_PYTHON_INSTRUMENT_DUMP=path     write snapshot() as JSON to path...
+#     LEARN_PYTHON_INSTRUMENT_INTERVAL=10   ...every N seconds and at exit
+#
+# The switch is read once, at import: when it is off, @instrumented hands
+# back the very same function object, so there is no wrapper and no cost.
+# Set the variables before the first `import learn_python.pattern`.
+#
+#     from learn_python import instrument
+#     instrument.snapshot()["learn_python.pattern.printC"]
+#     # → {"count": 3, "total_ns": ..., "mean_ns": ..., "p50_ns": ..., "p99_ns": ...}
+
+import os
+
+ENV = "LEARN_PYTHON_INSTRUMENT"
+
+
+def _flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false", "no")
+
+
+ENABLED = _flag(ENV)
+TRACK_ALLOC = ENABLED and _flag(ENV + "_ALLOC")
+
+_registry = {}  # "module.qualname" -> _Stats
+
+
+def instrumented(fn):
+    """Decorator: time every call of `fn` when instrumentation is enabled."""
+    if not ENABLED:
+        return fn
+    return _wrap(fn)
+
+
+if ENABLED:
+    import atexit
+    import functools
+    import json
+    import threading
+    import time
+    import tracemalloc
+
+    from .latency import Histogram
+
+    _lock = threading.Lock()
+    _dumper = None
+
+    class _Stats:
+        __slots__ = ("latency", "alloc_bytes")
+
+        def __init__(self):
+            self.latency = Histogram()
+            self.alloc_bytes = 0  # net traced bytes still held after the calls
+
+        def summary(self) -> dict:
+            data = self.latency.summary()
+            data["total_ns"] = self.latency.total_ns
+            if TRACK_ALLOC:
+                data["alloc_bytes"] = self.alloc_bytes
+            return data
+
+    def _wrap(fn):
+        stats = _registry.setdefault(f"{fn.__module__}.{fn.__qualname__}", _Stats())
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            before = tracemalloc.get_traced_memory()[0] if TRACK_ALLOC else 0
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                after = tracemalloc.get_traced_memory()[0] if TRACK_ALLOC else 0
+                with _lock:
+                    stats.latency.record(elapsed)
+                    stats.alloc_bytes += after - before
+        return wrapper
+
+    if TRACK_ALLOC and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def snapshot() -> dict:
+    """Per-function stats so far; {} when instrumentation is disabled."""
+    if not ENABLED:
+        return {}
+    with _lock:
+        return {name: stats.summary() for name, stats in _registry.items()
+                if stats.latency.count}
+
+
+def reset() -> None:
+    """Forget everything recorded so far (the functions stay instrumented)."""
+    if not ENABLED:
+        return
+    with _lock:
+        for stats in _registry.values():  # the wrappers hold these objects
+            stats.__init__()
+
+
+def dump(path: str) -> None:
+    """Write snapshot() to `path` as JSON, atomically."""
+    # Imported here, not at the top: they are only loaded up front when
+    # instrumentation is on, and dump() works (with no functions) when it's off.
+    import json
+    import time
+
+    data = {"pid": os.getpid(), "time": time.time(), "functions": snapshot()}
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def start_dumping(path: str, interval: float = 10.0) -> None:
+    """dump(path) every `interval` seconds from a daemon thread, and at exit."""
+    global _dumper
+    if not ENABLED:
+        return
+    stop_dumping()
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            dump(path)
+
+    thread = threading.Thread(target=run, name="instrument-dump", daemon=True)
+    _dumper = (thread, stop, path)
+    thread.start()
+
+
+def stop_dumping() -> None:
+    """Stop the periodic dump, writing one last snapshot first."""
+    global _dumper
+    if not ENABLED or _dumper is None:
+        return
+    thread, stop, path = _dumper
+    _dumper = None
+    stop.set()
+    thread.join()
+    dump(path)
+
+
+if ENABLED:
+    atexit.register(stop_dumping)
+    if os.environ.get(ENV + "_DUMP"):
+        start_dumping(os.environ[ENV + "_DUMP"],
+                      float(os.environ.get(ENV + "_INTERVAL", 10.0)))
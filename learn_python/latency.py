@@ -0,0 +1,63 @@
+########################
+# 📌 Latency histogram shared by router.py and instrument.py
+########################
+
+# Both modules time calls in nanoseconds and report count, mean, p50 and p99.
+# Power-of-two buckets alone are cheap but only say "p99 is somewhere in
+# [2**(b-1), 2**b)" — up to 2x off. So a Histogram also keeps a bounded
+# reservoir sample of the raw durations (Vitter's algorithm R): every
+# duration recorded so far has the same chance of being in it, and the
+# percentiles are read from the sorted sample.
+#
+#   - up to SAMPLE_SIZE calls: the exact nearest-rank percentile;
+#   - after that: an estimate from a uniform sample of SAMPLE_SIZE durations,
+#     always one that was really measured.
+#
+#     h = Histogram()
+#     h.record(1_250)
+#     h.percentile(99)        # ns
+#     h.buckets               # the coarse shape, bucket b = [2**(b-1), 2**b)
+
+from random import random
+
+SAMPLE_SIZE = 1024
+
+
+class Histogram:
+    """Latency histogram: power-of-two buckets plus a bounded sample."""
+
+    __slots__ = ("count", "total_ns", "buckets", "_sample")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.buckets = [0] * 64  # bucket b holds durations in [2**(b-1), 2**b)
+        self._sample = []
+
+    def record(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        self.buckets[min(ns.bit_length(), 63)] += 1
+        if len(self._sample) < SAMPLE_SIZE:
+            self._sample.append(ns)
+        else:
+            # keep the new duration with probability SAMPLE_SIZE / count
+            slot = int(random() * self.count)
+            if slot < SAMPLE_SIZE:
+                self._sample[slot] = ns
+
+    def percentile(self, p: float) -> int:
+        """Nearest-rank p-th percentile in ns (exact up to SAMPLE_SIZE calls)."""
+        if not self._sample:
+            return 0
+        ordered = sorted(self._sample)
+        rank = -(-len(ordered) * p // 100)  # ceil without float rounding
+        return ordered[min(max(int(rank), 1), len(ordered)) - 1]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+        }
@@ -0,0 +1,117 @@
+########################
+# 📌 Flat, strided matrices with a cache-friendly transpose
+########################
+
+# data_structure.py transposes a list of lists with a nested comprehension or
+# `list(zip(*matrix))`; both build a new list/tuple per row and walk memory
+# column by column. Here a matrix is one flat array('d') plus strides:
+#   - `m.T` swaps the strides, so it is a view and copies nothing
+#   - `m.transpose()` copies in square tiles so reads and writes both stay
+#     inside a cache-sized block, and each tile row is one strided slice copy
+#   - with NumPy installed, the copy is done by NumPy straight into the array
+
+from array import array
+
+from ._optional import numpy
+
+# 256 x 256 float64 = 512 KiB, about one L2 cache. Smaller tiles fit L1 but pay
+# more per-slice interpreter overhead than they save in pure Python.
+TILE = 256
+
+
+class Matrix:
+    """rows x cols matrix over a flat array; element (i, j) is at
+    data[offset + i * strides[0] + j * strides[1]]."""
+
+    def __init__(self, rows: int, cols: int, data=None, typecode: str = "d",
+                 strides=None, offset: int = 0):
+        if data is None:
+            data = array(typecode, bytes(rows * cols * array(typecode).itemsize))
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+        self.strides = strides if strides is not None else (cols, 1)
+        self.offset = offset
+
+    @classmethod
+    def from_rows(cls, rows, typecode: str = "d"):
+        rows = list(rows)
+        cols = len(rows[0]) if rows else 0
+        data = array(typecode)
+        for row in rows:
+            if len(row) != cols:
+                raise ValueError("all rows must have the same length")
+            data.extend(row)
+        return cls(len(rows), cols, data, typecode)
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def typecode(self) -> str:
+        return self.data.typecode
+
+    @property
+    def T(self) -> "Matrix":
+        """Transposed view sharing this matrix's data (no copy)."""
+        return Matrix(self.cols, self.rows, self.data, self.typecode,
+                      self.strides[::-1], self.offset)
+
+    def is_contiguous(self) -> bool:
+        return self.strides == (self.cols, 1) and self.offset == 0 \
+            and len(self.data) == self.rows * self.cols
+
+    def __getitem__(self, index):
+        i, j = index
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("matrix index out of range")
+        return self.data[self.offset + i * self.strides[0] + j * self.strides[1]]
+
+    def row(self, i: int) -> array:
+        if self.cols == 0:
+            return array(self.typecode)
+        start = self.offset + i * self.strides[0]
+        stop = start + (self.cols - 1) * self.strides[1] + 1
+        return self.data[start:stop:self.strides[1]]
+
+    def tolist(self) -> list:
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def copy(self, tile: int = TILE) -> "Matrix":
+        """Contiguous row-major copy, filled one tile at a time."""
+        out = Matrix(self.rows, self.cols, typecode=self.typecode)
+        if numpy() is not None:
+            self.to_numpy(out)
+            return out
+        src, dst = self.data, out.data
+        row_stride, col_stride = self.strides
+        for i0 in range(0, self.rows, tile):
+            for j0 in range(0, self.cols, tile):
+                j1 = min(j0 + tile, self.cols)
+                for i in range(i0, min(i0 + tile, self.rows)):
+                    start = self.offset + i * row_stride + j0 * col_stride
+                    stop = start + (j1 - j0 - 1) * col_stride + 1
+                    dst[i * self.cols + j0:i * self.cols + j1] = src[start:stop:col_stride]
+        return out
+
+    def transpose(self, tile: int = TILE) -> "Matrix":
+        """Contiguous transposed copy; use `.T` when a view is enough."""
+        return self.T.copy(tile)
+
+    def to_numpy(self, out: "Matrix" = None):
+        """Return a NumPy view of this matrix (or copy it into `out`)."""
+        np = numpy()
+        if np is None:
+            raise ImportError("to_numpy() needs NumPy installed")
+        base = np.frombuffer(self.data, dtype=self.typecode)
+        itemsize = base.itemsize
+        view = np.lib.stride_tricks.as_strided(
+            base[self.offset:], shape=(self.rows, self.cols),
+            strides=(self.strides[0] * itemsize, self.strides[1] * itemsize),
+            writeable=False)
+        if out is None:
+            return view
+        np.frombuffer(out.data, dtype=out.typecode).reshape(out.shape)[...] = view
+        return out
+
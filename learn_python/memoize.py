@@ -0,0 +1,134 @@
+########################
+# 📌 memoize: a result cache for good_func-style functions
+########################
+
+# functools.lru_cache refuses list/dict arguments and hands every caller the
+# *same* result object — mutate it and you have corrupted the cache, which is
+# the bad_func shared-default bug from control_flow.py all over again. This
+# decorator:
+#   - keys calls by the structure of their arguments, so lists, dicts and sets
+#     work (equal contents → same key)
+#   - hands out a fresh copy of mutable results, so callers cannot touch the
+#     cached value
+#   - bounds the cache with LRU eviction and/or a TTL in seconds
+#   - can persist results to a shelve file so they survive between runs
+#
+# Only use it on functions whose result depends on the arguments alone:
+# a cache hit skips the call, and with it any side effects.
+#
+#     @memoize(maxsize=10_000, ttl=3600, path="results.db")
+#     def good_func(x, arr=None): ...
+
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_IMMUTABLE = (int, float, complex, str, bytes, bool, type(None), frozenset)
+
+
+def _freeze(value):
+    """Hashable, order-independent stand-in for a (possibly unhashable) value."""
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        items = ((_freeze(k), _freeze(v)) for k, v in value.items())
+        return "dict", tuple(sorted(items, key=repr))
+    if isinstance(value, (set, frozenset)):
+        return type(value).__name__, tuple(sorted(map(_freeze, value), key=repr))
+    hash(value)  # anything else must be hashable already
+    return value
+
+
+def _is_immutable(value) -> bool:
+    if isinstance(value, tuple):
+        return all(map(_is_immutable, value))
+    return isinstance(value, _IMMUTABLE)
+
+
+def memoize(maxsize: int = 1024, ttl: float = None, path=None):
+    """Decorator caching results by argument structure (see module notes).
+
+    maxsize: entries kept in memory (None = unbounded), least recently used
+             go first. ttl: seconds an entry stays valid (None = forever).
+             path: shelve file to also store results in between runs.
+    """
+    def decorate(func):
+        entries = OrderedDict()  # key -> (stored_at, result)
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0}
+        store = None
+        if path is not None:
+            import hashlib  # only the on-disk cache needs these, and shelve
+            import shelve   # pulls in pickle: imported on first use
+            store = shelve.open(path)
+        prefix = f"{func.__module__}.{func.__qualname__}"
+
+        def fresh(stored_at) -> bool:
+            return ttl is None or time.monotonic() - stored_at < ttl
+
+        def lookup(key, disk_key):
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and fresh(entry[0]):
+                    entries.move_to_end(key)
+                    return entry[1]
+                entries.pop(key, None)
+                if store is not None and disk_key in store:
+                    wall_time, result = store[disk_key]
+                    age = time.time() - wall_time
+                    if ttl is None or age < ttl:
+                        remember(key, result, time.monotonic() - age)
+                        return result
+            raise KeyError(key)
+
+        def remember(key, result, stored_at) -> None:
+            entries[key] = (stored_at, result)
+            entries.move_to_end(key)
+            if maxsize is not None and len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _freeze((args, kwargs))
+            disk_key = None
+            if store is not None:
+                disk_key = hashlib.sha256(f"{prefix}:{key!r}".encode()).hexdigest()
+            try:
+                result = lookup(key, disk_key)
+                stats["hits"] += 1
+            except KeyError:
+                stats["misses"] += 1
+                result = func(*args, **kwargs)
+                if not _is_immutable(result):
+                    result = copy.deepcopy(result)  # the caller may still hold the original
+                with lock:
+                    remember(key, result, time.monotonic())
+                    if store is not None:
+                        store[disk_key] = (time.time(), result)
+            return result if _is_immutable(result) else copy.deepcopy(result)
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(stats["hits"], stats["misses"], maxsize, len(entries))
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                stats["hits"] = stats["misses"] = 0
+                if store is not None:
+                    store.clear()
+
+        def close() -> None:
+            """Flush and close the persistent store, if any."""
+            if store is not None:
+                store.close()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.close = close
+        return wrapper
+
+    return decorate
@@ -0,0 +1,246 @@
+import sys
+from collections import OrderedDict, namedtuple
+
+from ._optional import numpy
+from .instrument import instrumented
+
+# Set by _load_numpy() the first time a numpy/auto backend is asked for.
+np = None
+
+
+CacheInfo = namedtuple("CacheInfo",
+                       ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"])
+
+
+class RowCache:
+    """LRU cache of rendered rows, keyed by (pattern, n, row).
+
+    Bounded by both row count and total characters held, so a few huge rows
+    can't pin megabytes the way 1024 rows of n=10_000 would.
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: int = 1 << 20):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._rows = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key, build):
+        """Return the cached row for `key`, calling `build(n, row)` on a miss."""
+        try:
+            row = self._rows[key]
+        except KeyError:
+            self.misses += 1
+            row = build(*key[1:])
+            if self.maxsize > 0 and len(row) <= self.maxbytes:
+                self._rows[key] = row
+                self._bytes += len(row)
+                while len(self._rows) > self.maxsize or self._bytes > self.maxbytes:
+                    _, evicted = self._rows.popitem(last=False)  # least recently used
+                    self._bytes -= len(evicted)
+            return row
+        self.hits += 1
+        self._rows.move_to_end(key)
+        return row
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._rows),
+                         self.maxbytes, self._bytes)
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# Opt-in: pass cache=row_cache to let nForest/printC renders with overlapping
+# n share rows. Without a cache every row is built on the fly, so iter_printC
+# holds one row at a time.
+row_cache = RowCache()
+
+
+def _iter_rows(name: str, build, n: int, count: int, cache):
+    if cache is None or count > cache.maxsize:
+        # A render taller than the cache evicts each row before it is reused,
+        # so caching it would only cost memory.
+        for r in range(count):
+            yield build(n, r)
+        return
+    for r in range(count):
+        yield cache.get((name, n, r), build)
+
+
+########################
+## NumPy backend
+########################
+
+# The grids below are computed with broadcasted index arithmetic instead of
+# per-character loops, then trimmed to the real row lengths with a boolean
+# mask so the bytes match the pure-Python rows exactly.
+
+_GRID_CELLS = 1 << 22  # cells per block, bounds memory for huge n
+
+
+def _load_numpy():
+    global np
+    np = numpy()
+    return np
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend in ("auto", "numpy"):
+        _load_numpy()
+    if backend == "auto":
+        return "python" if np is None else "numpy"
+    if backend == "numpy" and np is None:
+        raise ImportError("the numpy backend needs NumPy installed")
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"unknown backend: {backend!r}")
+    return backend
+
+
+def _nForest_grid(n: int, lo: int, hi: int) -> bytes:
+    r = np.arange(lo, hi)[:, None]
+    c = np.arange(4 * n - 1)[None, :]
+    d = np.abs(r - (n - 1))          # distance from the widest row
+    pad = 2 * d
+    length = 4 * n - 2 * d - 2       # row length without the newline
+    grid = np.where((c >= pad) & (c % 2 == 0), ord("*"), ord(" "))
+    grid = np.where(c == length, ord("\n"), grid).astype(np.uint8)
+    return grid[c <= length].tobytes()
+
+
+def _printC_grid(n: int, lo: int, hi: int) -> bytes:
+    # The last row of printC is always empty, so only rows < 2n - 1 have tokens.
+    last = 2 * n - 1
+    out = b""
+    if lo < min(hi, last):
+        r = np.arange(lo, min(hi, last))[:, None]
+        t = np.arange(2 * n - 1)[None, :]
+        values = n - np.minimum(np.minimum(r, 2 * n - 2 - r),
+                                np.minimum(t, 2 * n - 2 - t))
+        # Digit map: row v holds the bytes of f"{v} ", padded to a fixed width.
+        width = len(str(n)) + 1
+        digits = np.zeros((n + 1, width), dtype=np.uint8)
+        lengths = np.zeros(n + 1, dtype=np.intp)
+        for v in range(1, n + 1):
+            token = f"{v} ".encode()
+            digits[v, :len(token)] = np.frombuffer(token, dtype=np.uint8)
+            lengths[v] = len(token)
+        rows = values.shape[0]
+        grid = digits[values].reshape(rows, -1)
+        mask = (np.arange(width) < lengths[values][..., None]).reshape(rows, -1)
+        grid = np.concatenate([grid, np.full((rows, 1), ord("\n"), np.uint8)], axis=1)
+        mask = np.concatenate([mask, np.ones((rows, 1), bool)], axis=1)
+        out = grid[mask].tobytes()
+    if lo <= last < hi:
+        out += b"\n"
+    return out
+
+
+def _write_grid(render, n: int, rows: int, width: int, file) -> None:
+    step = max(1, _GRID_CELLS // max(width, 1))
+    for lo in range(0, rows, step):
+        _write_bytes(render(n, lo, min(lo + step, rows)), file)
+
+
+def _write_bytes(data: bytes, file) -> None:
+    # `file` is a text stream for every backend, as for print(): anything with
+    # write(str). The grid is ASCII, so decoding it is a plain copy, and the
+    # stream still applies its own newline translation.
+    file.write(data.decode("ascii"))
+
+
+def _nForest_row(n: int, r: int) -> str:
+    # Each row is one repeat of the padding plus one repeat of the stars,
+    # so building it is a single allocation instead of O(n) `+=` copies.
+    if r < n:
+        return "  " * (n - (r + 1)) + "* " * (2 * (r + 1) - 1)
+    i = r - n + 1
+    return "  " * i + "* " * (2 * n - (2 * i + 1))
+
+
+def iter_nForest(n: int, cache: RowCache = None):
+    """Yield the rows of the forest one by one (without the trailing newline)."""
+    return _iter_rows("nForest", _nForest_row, n, max(2 * n - 1, 0), cache)
+
+
+@instrumented
+def write_nForest(n: int, file=None, cache: RowCache = None,
+                  backend: str = "python") -> None:
+    """Write the whole forest to `file` (stdout by default) in one write."""
+    if file is None:
+        file = sys.stdout
+    if _resolve_backend(backend) == "numpy":
+        _write_grid(_nForest_grid, n, 2 * n - 1, 4 * n - 1, file)
+        return
+    file.write("".join(row + "\n" for row in iter_nForest(n, cache)))
+
+
+@instrumented
+def nForest(n:int) ->None:
+    # Same output as printing every row, but with one buffered write.
+    write_nForest(n)
+
+
+def _printC_row(n: int, r: int) -> str:
+    if r < n:
+        i = r
+        left = "".join(f"{n - j} " for j in range(i))
+        middle = f"{n - i} " * (2 * n - (2 * i + 1))
+        right = "".join(f"{n - i + (j + 1)} " for j in range(i))
+        return left + middle + right
+    i = r - n
+    la_pat = n - (i + 1)
+    left = "".join(f"{n - j} " for j in range(la_pat))
+    middle = "" if i == n - 1 else f"{i + 2} " * (2 * i + 1)
+    right = "".join(f"{n - la_pat + (j + 1)} " for j in range(la_pat))
+    return left + middle + right
+
+
+def iter_printC(n: int, cache: RowCache = None):
+    """Yield the rows of the number diamond lazily, one row at a time."""
+    return _iter_rows("printC", _printC_row, n, max(2 * n, 0), cache)
+
+
+@instrumented
+def write_printC(n: int, file=None, chunk_size: int = 1 << 16,
+                 cache: RowCache = None, backend: str = "python") -> None:
+    """Stream the diamond to `file` (stdout by default) in ~chunk_size writes."""
+    if file is None:
+        file = sys.stdout
+    if _resolve_backend(backend) == "numpy":
+        width = (2 * n - 1) * (len(str(n)) + 1) + 1
+        _write_grid(_printC_grid, n, 2 * n, width, file)
+        return
+    _write_rows(iter_printC(n, cache), file, chunk_size)
+
+
+def _write_rows(rows, file, chunk_size: int) -> None:
+    # Only the current chunk is ever held in memory, never the whole pattern.
+    chunk = []
+    size = 0
+    for row in rows:
+        chunk.append(row)
+        chunk.append("\n")
+        size += len(row) + 1
+        if size >= chunk_size:
+            file.write("".join(chunk))
+            chunk.clear()
+            size = 0
+    if chunk:
+        file.write("".join(chunk))
+
+
+@instrumented
+def printC(n: int) -> None:
+    write_printC(n)
+
+
+def run() -> None:
+    nForest(10)
+    print(" ")
+    printC(9)
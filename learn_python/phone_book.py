@@ -0,0 +1,224 @@
+########################
+# 📌 PhoneBook: a compact, dict-like name → number store
+########################
+
+# data_structure.py keeps contacts in plain dicts (`tel`, `contact_dict`).
+# Every entry there costs a str object, an int object and a dict slot. Here
+# all names live back to back in one bytearray "arena", numbers sit in an
+# array('q'), and an open-addressing hash index (an array of entry numbers)
+# finds a name without any per-entry Python objects:
+#
+#     entry i:  name  = arena[starts[i] : starts[i] + lengths[i]]
+#               phone = numbers[i]
+#
+# It supports the dict operations the tutorial uses — book['guido'] = 4127,
+# book['jack'], del book['sape'], 'guido' in book, list(book), sorted(book) —
+# and saves/loads with a single bulk write/read.
+
+import struct
+import zlib
+from array import array
+
+_EMPTY = -1    # index slot never used
+_DELETED = -2  # index slot whose entry was deleted (keep probing past it)
+
+_HEADER = struct.Struct("<8sQQQ")  # magic, entries, arena bytes, index slots
+_MAGIC = b"PHONEBK1"
+
+
+class PhoneBook:
+    """Mapping of str names to int phone numbers with compact storage."""
+
+    def __init__(self, items=()):
+        self._arena = bytearray()
+        self._starts = array("Q")
+        self._lengths = array("I")
+        self._hashes = array("I")
+        self._numbers = array("q")
+        self._alive = bytearray()
+        self._index = array("q", [_EMPTY]) * 8
+        self._live = 0
+        self._used_slots = 0  # live entries + tombstones in the index
+        if hasattr(items, "items"):
+            items = items.items()
+        for name, number in items:
+            self[name] = number
+
+    # Hash index
+    def _find(self, key: bytes, h: int):
+        """Return (slot, entry) for key; entry is -1 when it is missing.
+
+        For a missing key, slot is where it should be inserted.
+        """
+        index = self._index
+        mask = len(index) - 1
+        slot = h & mask
+        free = -1
+        while True:
+            entry = index[slot]
+            if entry == _EMPTY:
+                return (slot if free < 0 else free), -1
+            if entry == _DELETED:
+                if free < 0:
+                    free = slot
+            elif self._hashes[entry] == h:
+                start = self._starts[entry]
+                if self._arena[start:start + self._lengths[entry]] == key:
+                    return slot, entry
+            slot = (slot + 1) & mask
+
+    def _rebuild_index(self, size: int) -> None:
+        index = array("q", [_EMPTY]) * size
+        mask = size - 1
+        for entry, alive in enumerate(self._alive):
+            if alive:
+                slot = self._hashes[entry] & mask
+                while index[slot] != _EMPTY:
+                    slot = (slot + 1) & mask
+                index[slot] = entry
+        self._index = index
+        self._used_slots = self._live
+
+    # Mapping API
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, name) -> bool:
+        if not isinstance(name, str):
+            return False
+        key = name.encode()
+        return self._find(key, zlib.crc32(key))[1] >= 0
+
+    def __getitem__(self, name: str) -> int:
+        if not isinstance(name, str):
+            raise KeyError(name)  # like a dict that only ever held str keys
+        key = name.encode()
+        entry = self._find(key, zlib.crc32(key))[1]
+        if entry < 0:
+            raise KeyError(name)
+        return self._numbers[entry]
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __setitem__(self, name: str, number: int) -> None:
+        key = name.encode()
+        # Pack first: a number array('q') refuses (too big, not an int) must
+        # fail before any column grows, or the columns fall out of step.
+        number = array("q", (number,))[0]
+        h = zlib.crc32(key)
+        slot, entry = self._find(key, h)
+        if entry >= 0:
+            self._numbers[entry] = number
+            return
+        entry = len(self._numbers)
+        self._numbers.append(number)
+        self._starts.append(len(self._arena))
+        self._lengths.append(len(key))
+        self._hashes.append(h)
+        self._alive.append(1)
+        self._arena += key
+        if self._index[slot] == _EMPTY:
+            self._used_slots += 1
+        self._index[slot] = entry
+        self._live += 1
+        if 2 * self._used_slots > len(self._index):  # keep load factor <= 1/2
+            self._rebuild_index(2 * len(self._index) if 4 * self._live > len(self._index)
+                                else len(self._index))
+
+    def __delitem__(self, name: str) -> None:
+        if not isinstance(name, str):
+            raise KeyError(name)
+        key = name.encode()
+        slot, entry = self._find(key, zlib.crc32(key))
+        if entry < 0:
+            raise KeyError(name)
+        self._index[slot] = _DELETED
+        self._alive[entry] = 0
+        self._live -= 1
+        dead = len(self._alive) - self._live
+        if dead > 1024 and dead > self._live:
+            self.compact()
+
+    def _name(self, entry: int) -> str:
+        start = self._starts[entry]
+        return self._arena[start:start + self._lengths[entry]].decode()
+
+    def __iter__(self):
+        """Names in insertion order, like a dict."""
+        for entry, alive in enumerate(self._alive):
+            if alive:
+                yield self._name(entry)
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for entry, alive in enumerate(self._alive):
+            if alive:
+                yield self._numbers[entry]
+
+    def items(self):
+        for entry, alive in enumerate(self._alive):
+            if alive:
+                yield self._name(entry), self._numbers[entry]
+
+    def __repr__(self) -> str:
+        return f"PhoneBook({dict(self.items())!r})"
+
+    def compact(self) -> None:
+        """Drop deleted entries from the arena and arrays."""
+        live = [entry for entry, alive in enumerate(self._alive) if alive]
+        arena = bytearray()
+        starts = array("Q")
+        for entry in live:
+            starts.append(len(arena))
+            start = self._starts[entry]
+            arena += self._arena[start:start + self._lengths[entry]]
+        self._arena = arena
+        self._starts = starts
+        self._lengths = array("I", (self._lengths[e] for e in live))
+        self._hashes = array("I", (self._hashes[e] for e in live))
+        self._numbers = array("q", (self._numbers[e] for e in live))
+        self._alive = bytearray(b"\x01") * len(live)
+        size = 8
+        while size < 4 * len(live):
+            size *= 2
+        self._rebuild_index(size)
+
+    # Persistence
+    def save(self, path) -> None:
+        """Write the whole store with one write() call."""
+        self.compact()
+        header = _HEADER.pack(_MAGIC, len(self._numbers), len(self._arena),
+                              len(self._index))
+        with open(path, "wb") as f:
+            f.write(b"".join([header, self._starts.tobytes(), self._lengths.tobytes(),
+                              self._hashes.tobytes(), self._numbers.tobytes(),
+                              self._index.tobytes(), self._arena]))
+
+    @classmethod
+    def load(cls, path) -> "PhoneBook":
+        """Read a store written by save(); the hash index is loaded, not rebuilt."""
+        with open(path, "rb") as f:
+            data = memoryview(f.read())
+        magic, entries, arena_size, slots = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{path!r} is not a PhoneBook file")
+        book = cls()
+        offset = _HEADER.size
+        for name, typecode, count in (("_starts", "Q", entries), ("_lengths", "I", entries),
+                                      ("_hashes", "I", entries), ("_numbers", "q", entries),
+                                      ("_index", "q", slots)):
+            column = array(typecode)
+            size = count * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            setattr(book, name, column)
+            offset += size
+        book._arena = bytearray(data[offset:offset + arena_size])
+        book._alive = bytearray(b"\x01") * entries
+        book._live = book._used_slots = entries
+        return book
@@ -0,0 +1,215 @@
+########################
+# 📌 Column store for (x, y) points
+########################
+
+# control_flow.Point is one object per point and where_is() prints one line
+# per match. Here the coordinates live in two flat array('d') columns instead,
+# and where_is_bulk() classifies every point at once — with NumPy when it is
+# installed, with one plain loop otherwise.
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+from ._optional import numpy
+
+CATEGORIES = ("origin", "y_axis", "x_axis", "elsewhere")
+
+
+class PointArray:
+    """Points stored as two float64 columns, `xs` and `ys`."""
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs=(), ys=()):
+        self.xs = array("d", xs)
+        self.ys = array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    @classmethod
+    def from_points(cls, points):
+        """Build from objects with .x and .y, e.g. control_flow.Point."""
+        self = cls()
+        for point in points:
+            self.append(point.x, point.y)
+        return self
+
+    def append(self, x, y) -> None:
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, i):
+        # Tuples work with the `case (0, y):` style patterns in control_flow.py.
+        return self.xs[i], self.ys[i]
+
+    def __iter__(self):
+        return zip(self.xs, self.ys)
+
+
+def where_is_bulk(points):
+    """Classify every point like where_is() does, without printing.
+
+    `points` is a PointArray or anything with `xs` and `ys` buffers. Returns
+    (counts, masks): both dicts keyed by CATEGORIES. Masks are NumPy bool
+    arrays, or bytearrays of 0/1 when NumPy is not installed.
+    """
+    np = numpy()
+    if np is not None:
+        xs = np.asarray(memoryview(points.xs))  # zero-copy views of the columns
+        ys = np.asarray(memoryview(points.ys))
+        on_y = xs == 0
+        on_x = ys == 0
+        masks = {
+            "origin": on_y & on_x,
+            "y_axis": on_y & ~on_x,
+            "x_axis": on_x & ~on_y,
+            "elsewhere": ~(on_y | on_x),
+        }
+        counts = {name: int(np.count_nonzero(mask)) for name, mask in masks.items()}
+        return counts, masks
+
+    masks = {name: bytearray(len(points.xs)) for name in CATEGORIES}
+    origin, y_axis, x_axis, elsewhere = (masks[name] for name in CATEGORIES)
+    for i, (x, y) in enumerate(zip(points.xs, points.ys)):
+        if x == 0:
+            if y == 0:
+                origin[i] = 1
+            else:
+                y_axis[i] = 1
+        elif y == 0:
+            x_axis[i] = 1
+        else:
+            elsewhere[i] = 1
+    counts = {name: mask.count(1) for name, mask in masks.items()}
+    return counts, masks
+
+
+########################
+# 💾 Memory-mapped point files
+########################
+
+# Layout (little-endian):
+#   header  b"POINTS", version u16, typecode (b"d" float64 or b"i" int32),
+#           7 pad bytes, count u64                         → 24 bytes
+#   xs      count values of the typecode
+#   ys      count values of the typecode
+# Opening maps the file and slices memoryviews out of it, so nothing is read
+# until a query touches the pages — even a 10 GB file opens instantly.
+
+_HEADER = struct.Struct("<6sHc7xQ")
+_MAGIC = b"POINTS"
+_VERSION = 1
+
+# Zero-copy slice of a point file; where_is_bulk() accepts it like a PointArray.
+PointColumns = namedtuple("PointColumns", ["xs", "ys"])
+
+
+def save_points(path, points, typecode: str = "d") -> None:
+    """Write a PointArray (or anything with xs/ys) as a point file."""
+    if typecode not in ("d", "i"):
+        raise ValueError("typecode must be 'd' (float64) or 'i' (int32)")
+    xs = _packed_column(points.xs, typecode)
+    ys = _packed_column(points.ys, typecode)
+    if sys.byteorder != "little":
+        xs.byteswap()
+        ys.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, typecode.encode(), len(xs)))
+        xs.tofile(f)
+        ys.tofile(f)
+
+
+def _packed_column(values, typecode: str) -> array:
+    if typecode == "d":
+        return array("d", values)
+    column = array("i", map(int, values))
+    if any(packed != value for packed, value in zip(column, values)):
+        raise ValueError("int32 point files need integral coordinates")
+    return column
+
+
+class PointFile:
+    """Read-only, memory-mapped view of a point file.
+
+    `xs` and `ys` are memoryviews straight into the mapping. Use it as a
+    context manager, and drop any chunks before it closes.
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise OSError("point files are little-endian")
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.typecode, size = _check_header(mapped, path)
+        except BaseException:
+            mapped.close()
+            raise
+        # Nothing below can fail: the header and the file length are known good.
+        self._mmap = mapped
+        self._view = memoryview(mapped)
+        start = _HEADER.size
+        self.xs = self._view[start:start + size].cast(self.typecode)
+        self.ys = self._view[start + size:start + 2 * size].cast(self.typecode)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def chunks(self, size: int = 1 << 20):
+        """Yield PointColumns of up to `size` points, without copying."""
+        for start in range(0, len(self.xs), size):
+            yield PointColumns(self.xs[start:start + size], self.ys[start:start + size])
+
+    def close(self) -> None:
+        self.xs.release()
+        self.ys.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except BufferError:
+            # A chunk is still alive, typically in the traceback of the error
+            # already propagating; that error is the one worth seeing, and the
+            # mapping goes away with the last view.
+            if exc_type is None:
+                raise
+
+
+def _check_header(mapped, path):
+    """(typecode, bytes per column) of a mapped point file, or ValueError."""
+    if len(mapped) < _HEADER.size:
+        raise ValueError(f"{path!r} is too short to be a point file")
+    magic, version, typecode, count = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"{path!r} is not a version {_VERSION} point file")
+    if typecode not in (b"d", b"i"):
+        raise ValueError(f"{path!r} has an unknown typecode {typecode!r}")
+    typecode = typecode.decode()
+    size = count * struct.calcsize(typecode)
+    if len(mapped) != _HEADER.size + 2 * size:
+        raise ValueError(f"{path!r} holds {len(mapped)} bytes, but {count} points "
+                         f"need {_HEADER.size + 2 * size}: truncated or corrupt")
+    return typecode, size
+
+
+def where_is_file(path, chunk_size: int = 1 << 20) -> dict:
+    """Count the where_is() categories of every point in a point file."""
+    totals = dict.fromkeys(CATEGORIES, 0)
+    with PointFile(path) as points:
+        for chunk in points.chunks(chunk_size):
+            counts, _ = where_is_bulk(chunk)
+            for name, count in counts.items():
+                totals[name] += count
+            del chunk
+    return totals
@@ -0,0 +1,255 @@
+########################
+# 📌 Prime numbers with a segmented Sieve of Eratosthenes
+########################
+
+# The loop-`else` example in control_flow.py tries every x in range(2, n),
+# which is O(n²) over a range. Here the range is sieved in constant-size
+# segments instead: only the base primes up to √hi are kept around, and each
+# segment is a bytearray (or an array of smallest prime factors), so memory
+# does not grow with hi.
+
+import math
+import sys
+from array import array
+from collections import deque
+from itertools import compress
+
+SEGMENT_SIZE = 1 << 18  # numbers per segment
+PARALLEL_SEGMENT_SIZE = 1 << 22  # bigger segments amortise the IPC per task
+
+_SMALL_LIMIT = 1 << 20  # is_prime() looks these up in a sieve
+_small_sieve = None
+
+# Deterministic Miller–Rabin witnesses for every n < 3.3 * 10**24.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _simple_sieve(limit: int) -> bytearray:
+    """Return flags for 0..limit-1 where flags[k] == 1 means k is prime."""
+    flags = bytearray(b"\x01") * limit
+    flags[:2] = bytes(min(2, limit))
+    for p in range(2, math.isqrt(limit - 1) + 1 if limit > 1 else 0):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return flags
+
+
+def _base_primes(hi: int) -> list:
+    """Primes up to √(hi - 1), enough to sieve any segment below hi."""
+    limit = math.isqrt(max(hi - 1, 0)) + 1
+    return list(compress(range(limit), _simple_sieve(limit)))
+
+
+def _first_multiple(p: int, lo: int) -> int:
+    # Start at p*p: smaller multiples already have a smaller prime factor.
+    return max(p * p, -(-lo // p) * p)
+
+
+def _sieve_segment(lo: int, hi: int, base) -> bytearray:
+    """Prime flags for lo..hi-1 (flags[k] == 1 means lo + k is prime)."""
+    size = hi - lo
+    flags = bytearray(b"\x01") * size
+    for k in range(lo, min(2, hi)):
+        flags[k - lo] = 0
+    for p in base:
+        start = _first_multiple(p, lo)
+        if start >= hi:
+            continue
+        flags[start - lo::p] = bytes(len(range(start - lo, size, p)))
+    return flags
+
+
+def _spf_segment(lo: int, hi: int, base) -> array:
+    """Smallest prime factor of each number in lo..hi-1, 0 for primes."""
+    size = hi - lo
+    spf = array("I", bytes(4 * size))
+    # Largest primes first, so a smaller factor overwrites a larger one.
+    for p in reversed(base):
+        start = _first_multiple(p, lo)
+        if start >= hi:
+            continue
+        spf[start - lo::p] = array("I", [p]) * len(range(start - lo, size, p))
+    return spf
+
+
+def _segments(lo: int, hi: int, segment_size: int):
+    for start in range(lo, hi, segment_size):
+        yield start, min(start + segment_size, hi)
+
+
+########################
+# ⚡ Parallel segments
+########################
+
+# Every worker gets the base primes once (as packed bytes) through the pool
+# initializer and sends back compact bytes per segment, never lists of ints.
+# Even numbers are never sent, since their answer is known:
+#   - iter_primes: one bit per odd number, so ~n/16 bytes cross the pipe for
+#     n numbers (~625 MB for the range up to 10**10, not 10 GB of flags)
+#   - iter_factors: the index of the smallest prime factor in the base
+#     primes, per odd number; 2 bytes while hi < ~6.7 * 10**11, so ~n bytes
+#     (~10 GB up to 10**10 instead of 40 GB), still far less than the
+#     report lines printed for those numbers
+# Results are merged back in range order with a bounded window of in-flight
+# segments, so the stream stays ordered and memory stays flat.
+
+_worker_base = None
+_worker_index_code = None
+
+_BITS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _pack_bits(flags) -> bytes:
+    """0/1 bytes -> bits, flags[0] in the lowest bit of the first byte."""
+    if not flags:
+        return b""
+    # int() and format() convert base 2 in linear time, so this stays in C.
+    return int(flags.translate(_BITS_TO_DIGITS)[::-1], 2).to_bytes(
+        (len(flags) + 7) // 8, "little")
+
+
+def _unpack_bits(data: bytes, count: int) -> bytes:
+    digits = format(int.from_bytes(data, "little"), "b").encode()
+    return digits.rjust(count, b"0")[::-1].translate(_DIGITS_TO_BITS)
+
+
+def _index_code(base) -> str:
+    """Smallest array typecode that can hold an index into `base`."""
+    return "B" if len(base) <= 0xFF else "H" if len(base) <= 0xFFFF else "I"
+
+
+def _init_worker(base: bytes) -> None:
+    global _worker_base, _worker_index_code
+    _worker_base = array("I", base)
+    _worker_index_code = _index_code(_worker_base)
+
+
+def _sieve_task(lo: int, hi: int) -> bytes:
+    """Bit-packed prime flags of the odd numbers in lo..hi-1."""
+    return _pack_bits(_sieve_segment(lo, hi, _worker_base)[1 - (lo & 1)::2])
+
+
+def _spf_task(lo: int, hi: int) -> bytes:
+    """For each odd number in lo..hi-1, the index in the base primes of its
+    smallest prime factor, or 0 if it is prime."""
+    first = lo | 1
+    size = len(range(first, hi, 2))
+    code = _worker_index_code
+    spf = array(code, bytes(array(code).itemsize * size))
+    # Largest primes first, so a smaller factor overwrites a larger one.
+    for i in range(len(_worker_base) - 1, 0, -1):  # base[0] == 2 has no odd multiples
+        p = _worker_base[i]
+        start = _first_multiple(p, first)
+        if start % 2 == 0:
+            start += p
+        if start >= hi:
+            continue
+        k = (start - first) // 2  # odd multiples are 2p apart, so p slots apart
+        spf[k::p] = array(code, [i]) * len(range(k, size, p))
+    return spf.tobytes()
+
+
+def _parallel_segments(task, lo: int, hi: int, base, segment_size: int, workers: int):
+    """Yield (start, stop, task result) for every segment, in order."""
+    from concurrent.futures import ProcessPoolExecutor  # heavy; parallel runs only
+
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                               initargs=(array("I", base).tobytes(),))
+    pending = deque()
+    try:
+        for start, stop in _segments(lo, hi, segment_size):
+            pending.append((start, stop, pool.submit(task, start, stop)))
+            if len(pending) >= 2 * workers:
+                start, stop, future = pending.popleft()
+                yield start, stop, future.result()
+        while pending:
+            start, stop, future = pending.popleft()
+            yield start, stop, future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def iter_primes(lo: int, hi: int, segment_size: int = None, workers: int = 1):
+    """Yield the primes in range(lo, hi) in order, one segment at a time.
+
+    With workers > 1 (e.g. os.cpu_count()) segments are sieved in a process pool.
+    """
+    lo = max(lo, 0)
+    if workers > 1:
+        segment_size = segment_size or PARALLEL_SEGMENT_SIZE
+        for start, stop, bits in _parallel_segments(_sieve_task, lo, hi, _base_primes(hi),
+                                                    segment_size, workers):
+            if start <= 2 < stop:
+                yield 2
+            odd = range(start | 1, stop, 2)
+            yield from compress(odd, _unpack_bits(bits, len(odd)))
+        return
+    base = _base_primes(hi)
+    for start, stop in _segments(lo, hi, segment_size or SEGMENT_SIZE):
+        yield from compress(range(start, stop), _sieve_segment(start, stop, base))
+
+
+def iter_factors(lo: int, hi: int, segment_size: int = None, workers: int = 1):
+    """Yield (n, x) for n in range(lo, hi), x being n's smallest prime factor.
+
+    x is None when n is prime, matching the `else` branch of the loop example.
+    """
+    lo = max(lo, 2)
+    base = _base_primes(hi)
+    if workers > 1:
+        segment_size = segment_size or PARALLEL_SEGMENT_SIZE
+        code = _index_code(base)
+        factor = [None] + base[1:]  # index -> odd prime factor, 0 -> prime
+        for start, stop, data in _parallel_segments(_spf_task, lo, hi, base,
+                                                    segment_size, workers):
+            odd = iter(array(code, data))
+            for n in range(start, stop):
+                if n & 1:
+                    yield n, factor[next(odd)]
+                else:
+                    yield n, (2 if n > 2 else None)
+        return
+    for start, stop in _segments(lo, hi, segment_size or SEGMENT_SIZE):
+        for n, x in zip(range(start, stop), _spf_segment(start, stop, base)):
+            yield n, (x or None)
+
+
+def factor_report(lo: int, hi: int, file=None, workers: int = 1) -> None:
+    """Print the same lines as the loop-`else` prime example in control_flow.py."""
+    if file is None:
+        file = sys.stdout
+    for n, x in iter_factors(lo, hi, workers=workers):
+        if x is None:
+            print(n, 'is a prime number', file=file)
+        else:
+            print(n, 'equals', x, '*', n // x, file=file)
+
+
+def is_prime(n: int) -> bool:
+    """Sieve lookup for small n, deterministic Miller–Rabin above that."""
+    global _small_sieve
+    if n < _SMALL_LIMIT:
+        if n < 2:
+            return False
+        if _small_sieve is None:
+            _small_sieve = _simple_sieve(_SMALL_LIMIT)
+        return bool(_small_sieve[n])
+    for p in _MR_BASES:
+        if n % p == 0:
+            return False
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
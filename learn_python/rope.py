@@ -0,0 +1,259 @@
+########################
+# 📌 Rope: strings you can splice without copying them
+########################
+
+# basics.py builds strings with `3 * 'un' + 'ium'`, `word[:2] + word[2:]`
+# and `'J' + word[1:]` — every one of those copies the whole string. That is
+# fine for "Python", and a disaster for prefix/suffix splicing on a
+# multi-MB document in a loop.
+#
+# A Rope is an immutable, height-balanced (AVL) binary tree whose leaves
+# point into the original str/bytes objects by (start, stop) offsets:
+#   - r1 + r2        joins the trees, O(log n)
+#   - r[i:j]         splits the tree; the new leaves share the old buffers
+#   - r[i]           walks one root-to-leaf path, O(log n)
+#   - str(r)/bytes(r) flattens once, on demand, and caches the result
+#
+#     doc = Rope(open("big.txt").read())
+#     doc = doc[:i] + "inserted" + doc[j:]     # no 100 MB copy
+#     doc.splice(i, j, "text")                 # same thing
+#     str(doc)                                 # one copy, at the end
+
+# Neighbouring leaves smaller than this are merged on concat so a loop of
+# tiny appends doesn't turn into a tree of one-character leaves.
+LEAF_MERGE = 512
+
+
+class _Leaf:
+    __slots__ = ("data", "start", "stop", "length")
+    height = 0
+
+    def __init__(self, data, start: int, stop: int):
+        self.data = data
+        self.start = start
+        self.stop = stop
+        self.length = stop - start
+
+    def piece(self):
+        if self.start == 0 and self.stop == len(self.data):
+            return self.data  # whole buffer, no copy
+        return self.data[self.start:self.stop]
+
+
+class _Concat:
+    __slots__ = ("left", "right", "length", "height")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.height = max(left.height, right.height) + 1
+
+
+def _balance(left, right):
+    """Concat two subtrees whose heights differ by at most 2, rotating if needed."""
+    if left.height > right.height + 1:
+        ll, lr = left.left, left.right
+        if ll.height >= lr.height:
+            return _Concat(ll, _Concat(lr, right))
+        return _Concat(_Concat(ll, lr.left), _Concat(lr.right, right))
+    if right.height > left.height + 1:
+        rl, rr = right.left, right.right
+        if rr.height >= rl.height:
+            return _Concat(_Concat(left, rl), rr)
+        return _Concat(_Concat(left, rl.left), _Concat(rl.right, rr))
+    return _Concat(left, right)
+
+
+def _join(left, right):
+    """Balanced concatenation in O(|height(left) - height(right)|)."""
+    if not left.length:
+        return right
+    if not right.length:
+        return left
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    if left.height == right.height == 0 and left.length + right.length <= LEAF_MERGE:
+        merged = left.piece() + right.piece()
+        return _Leaf(merged, 0, len(merged))
+    return _Concat(left, right)
+
+
+def _split(node, i: int):
+    """(node[:i], node[i:]) as two trees; leaves are cut by offset, not copied."""
+    if i <= 0:
+        return _empty(node), node
+    if i >= node.length:
+        return node, _empty(node)
+    if not node.height:
+        cut = node.start + i
+        return _Leaf(node.data, node.start, cut), _Leaf(node.data, cut, node.stop)
+    left = node.left
+    if i <= left.length:
+        a, b = _split(left, i)
+        return a, _join(b, node.right)
+    a, b = _split(node.right, i - left.length)
+    return _join(left, a), b
+
+
+def _empty(node):
+    while node.height:
+        node = node.left
+    return _Leaf(node.data[:0], 0, 0)
+
+
+def _leaves(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.height:
+            stack.append(node.right)
+            stack.append(node.left)
+        elif node.length:
+            yield node
+
+
+class Rope:
+    """Immutable str or bytes sequence with O(log n) concat, slice and index."""
+
+    __slots__ = ("_root", "_flat")
+
+    def __init__(self, data=""):
+        if isinstance(data, Rope):
+            self._root, self._flat = data._root, data._flat
+            return
+        if not isinstance(data, (str, bytes)):
+            raise TypeError(f"Rope needs str or bytes, not {type(data).__name__}")
+        self._root = _Leaf(data, 0, len(data))
+        self._flat = data
+
+    @classmethod
+    def _from_root(cls, root) -> "Rope":
+        rope = cls.__new__(cls)
+        rope._root = root
+        rope._flat = None
+        return rope
+
+    @property
+    def kind(self) -> type:
+        """str or bytes: what flatten() returns."""
+        return type(_empty(self._root).data)
+
+    @property
+    def depth(self) -> int:
+        return self._root.height
+
+    def _coerce(self, other):
+        if isinstance(other, Rope):
+            root = other._root
+        elif isinstance(other, (str, bytes)):
+            root = _Leaf(other, 0, len(other))
+        else:
+            return None
+        if type(_empty(root).data) is not self.kind:
+            raise TypeError(f"can't concat {self.kind.__name__} rope and "
+                            f"{type(_empty(root).data).__name__}")
+        return root
+
+    def __add__(self, other) -> "Rope":
+        root = self._coerce(other)
+        if root is None:
+            return NotImplemented
+        return Rope._from_root(_join(self._root, root))
+
+    def __radd__(self, other) -> "Rope":
+        root = self._coerce(other)
+        if root is None:
+            return NotImplemented
+        return Rope._from_root(_join(root, self._root))
+
+    def __mul__(self, times: int) -> "Rope":
+        # Repeated doubling: O(log times) joins, all sharing the same leaves.
+        result = _empty(self._root)
+        power = self._root
+        while times > 0:
+            if times & 1:
+                result = _join(result, power)
+            times >>= 1
+            if times:
+                power = _join(power, power)
+        return Rope._from_root(result)
+
+    __rmul__ = __mul__
+
+    def __len__(self) -> int:
+        return self._root.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._root.length)
+            if step != 1:
+                return Rope(self.flatten()[key])
+            if stop <= start:
+                return Rope._from_root(_empty(self._root))
+            root = _split(_split(self._root, stop)[0], start)[1]
+            return Rope._from_root(root)
+        i = key + self._root.length if key < 0 else key
+        if not 0 <= i < self._root.length:
+            raise IndexError("rope index out of range")
+        node = self._root
+        while node.height:
+            if i < node.left.length:
+                node = node.left
+            else:
+                i -= node.left.length
+                node = node.right
+        return node.data[node.start + i]  # an int for bytes, like bytes indexing
+
+    def splice(self, start: int, stop: int, text=None) -> "Rope":
+        """self[:start] + text + self[stop:] in O(log n); no text deletes."""
+        start, stop, _ = slice(start, stop).indices(self._root.length)
+        head = _split(self._root, start)[0]
+        # Cut the tail from the whole rope, not from what follows `start`:
+        # with stop < start it overlaps the head, exactly as in the str version.
+        tail = _split(self._root, stop)[1]
+        if text is None:
+            return Rope._from_root(_join(head, tail))
+        middle = self._coerce(text)
+        if middle is None:
+            raise TypeError(f"can't splice {type(text).__name__} into a rope")
+        return Rope._from_root(_join(_join(head, middle), tail))
+
+    def chunks(self):
+        """Yield the contents leaf by leaf, e.g. to write() without flattening."""
+        for leaf in _leaves(self._root):
+            yield leaf.piece()
+
+    def flatten(self):
+        """The whole rope as one str or bytes; computed once, then cached."""
+        if self._flat is None:
+            self._flat = _empty(self._root).data[:0].join(self.chunks())
+            self._root = _Leaf(self._flat, 0, len(self._flat))
+        return self._flat
+
+    def __str__(self) -> str:
+        return str(self.flatten())
+
+    def __bytes__(self) -> bytes:
+        if self.kind is not bytes:
+            raise TypeError("only a bytes rope converts with bytes()")
+        return self.flatten()
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Rope):
+            return len(self) == len(other) and self.flatten() == other.flatten()
+        if isinstance(other, (str, bytes)):
+            return len(self) == len(other) and self.flatten() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.flatten())
+
+    def __repr__(self) -> str:
+        return f"Rope({self.kind.__name__}, len={len(self)}, depth={self.depth})"
@@ -0,0 +1,156 @@
+########################
+# 📌 Router: demo(kind, *args, **kwargs)-shaped event dispatch
+########################
+
+# control_flow.demo takes a `kind` plus any positional/keyword arguments —
+# the shape of a generic event handler. Router sends each event to the
+# handler registered for its kind. How a handler is called (with `kind` in
+# front? with a list of events?) is said explicitly at registration, checked
+# once against the handler's signature and baked into a small call function,
+# so dispatch is a dict lookup plus a direct call.
+#
+#     router = Router()
+#
+#     @router.route("apple", pass_kind=True)
+#     def on_apple(kind, *args, **kwargs): ...     # gets kind, like demo()
+#
+#     @router.route("click", batch=True)
+#     def on_clicks(events): ...                   # list of Event tuples
+#
+#     router.dispatch("apple", 1, 2, 3, color="red", size="L")
+#     router.submit("click", x=1); router.submit("click", x=2); router.flush()
+#     router.latency("apple").percentile(99)       # ns
+
+import time
+from collections import defaultdict, namedtuple
+
+from .latency import Histogram
+
+Event = namedtuple("Event", ["kind", "args", "kwargs"])
+
+
+def _compile(kind, handler, batch: bool, pass_kind: bool):
+    """Build the per-route call function once, after checking the handler.
+
+    A batch handler must accept one list of Events; a pass_kind handler must
+    accept `kind` as its first positional argument. Anything else raises
+    TypeError here rather than on the first event.
+    """
+    import inspect  # slow to import (it loads ast), and only registration needs it
+
+    if batch and pass_kind:
+        raise ValueError("batch handlers get Events, which already carry the kind")
+    try:
+        signature = inspect.signature(handler)
+    except (TypeError, ValueError):
+        signature = None  # some builtins have no signature; trust the caller
+    if signature is not None and (batch or pass_kind):
+        try:
+            if batch:
+                signature.bind([])
+            else:
+                signature.bind_partial(kind)
+        except TypeError as exc:
+            shape = "one list of Events" if batch else "kind as its first argument"
+            raise TypeError(f"handler for {kind!r} must accept {shape}: {exc}") from None
+    if batch:
+        return handler
+    if pass_kind:
+        return lambda args, kwargs: handler(kind, *args, **kwargs)
+    return lambda args, kwargs: handler(*args, **kwargs)
+
+
+class Router:
+    """Dispatch events to per-kind handlers and time every call."""
+
+    def __init__(self):
+        self._routes = {}    # kind -> (call, batch)
+        self._pending = defaultdict(list)
+        self._latency = defaultdict(Histogram)  # one sample per handler call
+        self._events = defaultdict(int)         # events those calls handled
+
+    def route(self, kind, batch: bool = False, pass_kind: bool = False):
+        """Decorator registering a handler for `kind`.
+
+        A batch handler is called with a list of Events instead of one event's
+        arguments; use it with submit()/flush() to handle many at once. With
+        pass_kind, the handler gets `kind` before the event's arguments.
+        """
+        def register(handler):
+            self.add_route(kind, handler, batch, pass_kind)
+            return handler
+        return register
+
+    def add_route(self, kind, handler, batch: bool = False,
+                  pass_kind: bool = False) -> None:
+        if kind in self._routes:
+            raise ValueError(f"a handler is already registered for {kind!r}")
+        self._routes[kind] = (_compile(kind, handler, batch, pass_kind), batch)
+
+    def dispatch(self, kind, *args, **kwargs):
+        """Run the handler for one event now and return its result."""
+        try:
+            call, batch = self._routes[kind]
+        except KeyError:
+            raise LookupError(f"no handler registered for {kind!r}") from None
+        start = time.perf_counter_ns()
+        try:
+            if batch:
+                return call([Event(kind, args, kwargs)])
+            return call(args, kwargs)
+        finally:
+            self._latency[kind].record(time.perf_counter_ns() - start)
+            self._events[kind] += 1
+
+    def submit(self, kind, *args, **kwargs) -> None:
+        """Queue an event; flush() hands it to its handler later."""
+        if kind not in self._routes:
+            raise LookupError(f"no handler registered for {kind!r}")
+        self._pending[kind].append(Event(kind, args, kwargs))
+
+    def flush(self) -> None:
+        """Dispatch every queued event: one call per kind for batch handlers.
+
+        A handler that raises doesn't cost the other kinds their events:
+        every kind is still flushed, the failing kind's events after the one
+        that raised go back on the queue, and the first error is re-raised
+        at the end.
+        """
+        pending, self._pending = self._pending, defaultdict(list)
+        error = None
+        for kind, events in pending.items():
+            call, batch = self._routes[kind]
+            if not batch:
+                for i, event in enumerate(events):
+                    try:
+                        self.dispatch(kind, *event.args, **event.kwargs)
+                    except Exception as exc:
+                        # keep submit order: the leftovers go before anything
+                        # the handlers queued meanwhile
+                        if i + 1 < len(events):
+                            self._pending[kind][:0] = events[i + 1:]
+                        error = error or exc
+                        break
+                continue
+            start = time.perf_counter_ns()
+            try:
+                call(events)
+            except Exception as exc:
+                error = error or exc
+            finally:
+                self._latency[kind].record(time.perf_counter_ns() - start)
+                self._events[kind] += len(events)
+        if error is not None:
+            raise error
+
+    def latency(self, kind) -> Histogram:
+        return self._latency[kind]
+
+    def report(self) -> dict:
+        """Per-kind latency summaries: calls, events, mean, p50 and p99 in ns.
+
+        `count` is handler calls and the latencies are per call; a batch call
+        counts once there but len(batch) times in `events`.
+        """
+        return {kind: dict(histogram.summary(), events=self._events[kind])
+                for kind, histogram in self._latency.items()}
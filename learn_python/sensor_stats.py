@@ -0,0 +1,123 @@
+########################
+# 📌 Streaming NaN filter + running statistics for float64 sensor data
+########################
+
+# The raw_data example in data_structure.py drops NaNs by appending to a new
+# list one value at a time. For GB-scale feeds the data is read as float64
+# chunks straight into a reused buffer, NaNs are masked out per chunk, and
+# only the aggregates (count, mean, variance, min, max) are kept — constant
+# memory however long the stream is.
+#
+#     stats = RunningStats()
+#     with open("feed.f64", "rb") as f:
+#         for chunk in drop_nans(read_chunks(f)):
+#             stats.update_many(chunk)
+
+import math
+from array import array
+from itertools import filterfalse
+
+from ._optional import numpy
+
+CHUNK_SIZE = 1 << 16  # float64 values per chunk (512 KiB)
+
+
+def read_chunks(source, chunk_size: int = CHUNK_SIZE):
+    """Yield float64 memoryviews read from a binary file or socket.
+
+    Each view points into one reused buffer and is only valid until the next
+    chunk is requested; copy it (e.g. with array('d', view)) to keep it.
+    """
+    read_into = getattr(source, "readinto", None) or source.recv_into
+    buffer = bytearray(chunk_size * 8)
+    view = memoryview(buffer)
+    pending = 0  # bytes of a float64 split across two reads
+    while True:
+        got = read_into(view[pending:])
+        if not got:
+            break
+        total = pending + got
+        usable = total - total % 8
+        if usable:
+            yield view[:usable].cast("d")
+        pending = total - usable
+        buffer[:pending] = buffer[usable:total]
+    if pending:
+        raise ValueError(f"stream ended in the middle of a float64 ({pending} bytes left)")
+
+
+def drop_nans(chunks):
+    """Yield every chunk with its NaNs removed (a NumPy mask when available)."""
+    np = numpy()
+    for chunk in chunks:
+        if np is not None:
+            values = np.asarray(chunk)
+            yield values[~np.isnan(values)]
+        else:
+            yield array("d", filterfalse(math.isnan, chunk))
+
+
+class RunningStats:
+    """Count, mean, variance (Welford/Chan), min and max of a stream."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # sum of squared distances from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update_many(self, values) -> None:
+        """Fold in a whole chunk at once (NaNs must already be removed)."""
+        n = len(values)
+        if n == 0:
+            return
+        np = numpy()
+        if np is not None:
+            values = np.asarray(values, dtype=np.float64)
+            mean = float(values.mean())
+            m2 = float(np.square(values - mean).sum())
+            low, high = float(values.min()), float(values.max())
+        else:
+            mean = math.fsum(values) / n
+            m2 = math.fsum((v - mean) ** 2 for v in values)
+            low, high = min(values), max(values)
+        # Chan et al.: merge the chunk's (n, mean, m2) into the running totals.
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, like statistics.variance()."""
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def pvariance(self) -> float:
+        """Population variance, like statistics.pvariance()."""
+        return self._m2 / self.count if self.count else math.nan
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(count={self.count}, mean={self.mean}, "
+                f"variance={self.variance}, min={self.min}, max={self.max})")
+
+
+def summarize(values, chunk_size: int = CHUNK_SIZE) -> RunningStats:
+    """NaN-filtered statistics of a whole array (NumPy array, array('d'), list)."""
+    stats = RunningStats()
+    chunks = (values[i:i + chunk_size] for i in range(0, len(values), chunk_size))
+    for chunk in drop_nans(chunks):
+        stats.update_many(chunk)
+    return stats
@@ -0,0 +1,199 @@
+########################
+# 📌 Output sinks: where emit() sends what print() used to write
+########################
+
+# The control_flow.py functions used to call print() directly: one
+# synchronous, lock-taking stdout write per line on the caller's thread.
+# They now call emit(), which hands a Record to the current sink:
+#   - StreamSink (default): writes right away, exactly like print()
+#   - BatchedSink: a background thread writes records in batches
+#   - RingBufferSink: keeps the last N records in memory, dropping the
+#     oldest when full, for later drain()
+# Every sink renders as plain text (print-compatible) or, with
+# format="json", as one JSON object per line.
+#
+#     set_sink(BatchedSink(format="json"))
+#     greet("Bob")   # → {"ts": ..., "event": "greet", "message": "Good day, Bob!", ...}
+
+import atexit
+import sys
+import time
+from collections import deque, namedtuple
+
+Record = namedtuple("Record", ["ts", "event", "message", "fields"])
+
+
+class Sink:
+    """Base sink: renders records as text lines or JSON lines."""
+
+    def __init__(self, format: str = "text"):
+        if format not in ("text", "json"):
+            raise ValueError(f"unknown format: {format!r}")
+        self.format = format
+
+    def render(self, record: Record) -> str:
+        if self.format == "text":
+            return record.message + "\n"
+        # json (and the re it pulls in) is only imported for format="json",
+        # so the print()-style default keeps `import learn_python.sinks` cheap.
+        import json
+        data = {"ts": record.ts, "event": record.event, "message": record.message}
+        data.update(record.fields)
+        return json.dumps(data, ensure_ascii=False, default=repr) + "\n"
+
+    def write(self, record: Record) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class StreamSink(Sink):
+    """Write each record immediately; file=None means the current sys.stdout."""
+
+    def __init__(self, file=None, format: str = "text"):
+        super().__init__(format)
+        self.file = file
+
+    def write(self, record: Record) -> None:
+        (self.file or sys.stdout).write(self.render(record))
+
+    def flush(self) -> None:
+        (self.file or sys.stdout).flush()
+
+
+class BatchedSink(Sink):
+    """Queue records and write them from a background thread in batches.
+
+    emit() only appends to a deque; the writer wakes every `interval`
+    seconds (or once `max_batch` records are waiting) and writes them all
+    with one write() call. Whatever is still queued at interpreter exit is
+    written by an atexit close().
+
+    If writing to the file fails, the sink stops taking records: the queued
+    ones are dropped and the error is raised again from the next write(),
+    flush() or close().
+    """
+
+    def __init__(self, file=None, format: str = "text", max_batch: int = 1024,
+                 interval: float = 0.05):
+        # Imported here: only BatchedSink needs a thread, and emit() with the
+        # default sink is on the import path of every tutorial.
+        import threading
+
+        super().__init__(format)
+        self.file = file if file is not None else sys.stdout
+        self.max_batch = max_batch
+        self.interval = interval
+        self._records = deque()
+        # Guards _records, _idle and _closed together, so a write can't slip
+        # in between "queue is empty" and "mark idle", or land after close().
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self._error = None  # what the file raised, once writing has failed
+        self._thread = threading.Thread(target=self._run, name="BatchedSink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, record: Record) -> None:
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise ValueError("write to a closed BatchedSink")
+            self._records.append(record)
+            self._idle.clear()
+            full = len(self._records) >= self.max_batch
+        if full:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._drain()
+            with self._lock:
+                if self._closed and not self._records:
+                    return
+
+    def _drain(self) -> None:
+        with self._lock:
+            batch, self._records = self._records, deque()
+        try:
+            if batch:
+                self.file.write("".join(map(self.render, batch)))
+                self.file.flush()
+        except Exception as exc:
+            # Keep the thread alive and flush() returning: record the error
+            # for the caller and drop what can no longer be written.
+            with self._lock:
+                self._error = exc
+                self._records.clear()
+        with self._lock:
+            if not self._records:
+                self._idle.set()
+
+    def flush(self) -> None:
+        """Block until everything written so far has reached the file."""
+        self._wake.set()
+        self._idle.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Write what is queued, then stop the writer thread. Idempotent."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+        if self._error is not None:
+            raise self._error
+
+
+class RingBufferSink(Sink):
+    """Keep the last `capacity` rendered records; older ones are dropped."""
+
+    def __init__(self, capacity: int = 10_000, format: str = "text"):
+        super().__init__(format)
+        self._lines = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def write(self, record: Record) -> None:
+        if len(self._lines) == self._lines.maxlen:
+            self.dropped += 1
+        self._lines.append(self.render(record))
+
+    def drain(self) -> list:
+        """Return and forget the buffered lines, oldest first."""
+        lines = []
+        popleft = self._lines.popleft
+        while self._lines:
+            lines.append(popleft())
+        return lines
+
+
+_sink = StreamSink()
+
+
+def get_sink() -> Sink:
+    return _sink
+
+
+def set_sink(sink: Sink) -> Sink:
+    """Install `sink` for every emit(); returns the previous one."""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def emit(*values, sep: str = " ", event: str = None, **fields) -> None:
+    """print(*values)-style message, plus an event name and structured fields."""
+    message = sep.join(map(str, values))
+    _sink.write(Record(time.time(), event, message, fields))
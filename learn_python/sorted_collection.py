@@ -0,0 +1,181 @@
+########################
+# 📌 SortedList / SortedSet: stay sorted while you insert
+########################
+
+# The looping-techniques section calls sorted(basket) and sorted(set(basket))
+# to loop in order. Re-sorting a growing collection after every insert is
+# O(n log n) each time. These containers keep items sorted as they go in:
+# items live in a list of short sorted lists ("buckets") plus a list of each
+# bucket's max, so bisect finds the bucket in O(log n) and the insert only
+# shifts one short bucket. Iterating in order is then just walking buckets.
+#
+#     basket = SortedList(['apple', 'orange', 'apple', 'pear'])
+#     basket.add('banana')
+#     for fruit in basket: ...            # like sorted(basket)
+#     for fruit in basket.unique(): ...   # like sorted(set(basket))
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+
+BUCKET_SIZE = 1000  # buckets split in two when they grow past 2x this
+
+
+class SortedList:
+    """Sorted multiset with O(log n) add/remove and cheap ordered iteration."""
+
+    def __init__(self, iterable=()):
+        self._buckets = []
+        self._maxes = []
+        self._len = 0
+        self.update(iterable)
+
+    def update(self, iterable) -> None:
+        """Add many items; one sort for the batch instead of one insort each."""
+        items = sorted(chain(self, iterable))
+        self._buckets = [items[i:i + BUCKET_SIZE]
+                         for i in range(0, len(items), BUCKET_SIZE)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(items)
+
+    def add(self, item) -> None:
+        if not self._buckets:
+            self._buckets.append([item])
+            self._maxes.append(item)
+            self._len = 1
+            return
+        b = bisect_right(self._maxes, item)
+        if b == len(self._buckets):  # bigger than everything: last bucket
+            b -= 1
+            self._buckets[b].append(item)
+            self._maxes[b] = item
+        else:
+            insort(self._buckets[b], item)
+        self._len += 1
+        if len(self._buckets[b]) > 2 * BUCKET_SIZE:
+            bucket = self._buckets[b]
+            self._buckets[b:b + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes[b:b + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def _locate(self, item):
+        """(bucket, position) of the first item equal to `item`, or None."""
+        b = bisect_left(self._maxes, item)
+        if b == len(self._buckets):
+            return None
+        i = bisect_left(self._buckets[b], item)
+        if self._buckets[b][i] != item:
+            return None
+        return b, i
+
+    def remove(self, item) -> None:
+        """Remove one occurrence of item; ValueError if it is missing."""
+        found = self._locate(item)
+        if found is None:
+            raise ValueError(f"{item!r} not in SortedList")
+        self._delete(*found)
+
+    def discard(self, item) -> None:
+        found = self._locate(item)
+        if found is not None:
+            self._delete(*found)
+
+    def _delete(self, b: int, i: int) -> None:
+        bucket = self._buckets[b]
+        del bucket[i]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[b]
+            del self._maxes[b]
+        else:
+            self._maxes[b] = bucket[-1]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, item) -> bool:
+        return self._locate(item) is not None
+
+    def __iter__(self):
+        return chain.from_iterable(self._buckets)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(bucket) for bucket in reversed(self._buckets))
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        for bucket in self._buckets:
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def count(self, item) -> int:
+        return sum(1 for _ in self.irange(item, item))
+
+    def bisect_left(self, item) -> int:
+        """Number of items < item (like bisect.bisect_left on sorted(self))."""
+        b = bisect_left(self._maxes, item)
+        return sum(map(len, self._buckets[:b])) + (
+            bisect_left(self._buckets[b], item) if b < len(self._buckets) else 0)
+
+    def bisect_right(self, item) -> int:
+        """Number of items <= item (like bisect.bisect_right on sorted(self))."""
+        b = bisect_right(self._maxes, item)
+        return sum(map(len, self._buckets[:b])) + (
+            bisect_right(self._buckets[b], item) if b < len(self._buckets) else 0)
+
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        """Iterate over items between low and high (None = unbounded), in order."""
+        buckets, maxes = self._buckets, self._maxes
+        if low is None:
+            b, i = 0, 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            b = find(maxes, low)
+            i = find(buckets[b], low) if b < len(buckets) else 0
+        for bucket in buckets[b:]:
+            for item in bucket[i:] if i else bucket:
+                if high is not None and (item > high or (item == high and not inclusive[1])):
+                    return
+                yield item
+            i = 0
+
+    def unique(self):
+        """Distinct items in order, like sorted(set(self)) without the sort."""
+        sentinel = previous = object()
+        for item in self:
+            if previous is sentinel or item != previous:
+                yield item
+            previous = item
+
+
+class SortedSet(SortedList):
+    """SortedList that ignores duplicates, with O(1) membership via a set."""
+
+    def __init__(self, iterable=()):
+        self._members = set()
+        super().__init__(iterable)
+
+    def update(self, iterable) -> None:
+        new = set(iterable) - self._members
+        self._members |= new
+        super().update(new)
+
+    def add(self, item) -> None:
+        if item not in self._members:
+            self._members.add(item)
+            super().add(item)
+
+    def _delete(self, b: int, i: int) -> None:
+        self._members.discard(self._buckets[b][i])
+        super()._delete(b, i)
+
+    def __contains__(self, item) -> bool:
+        return item in self._members
+
+    def unique(self):
+        return iter(self)
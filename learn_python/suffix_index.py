@@ -0,0 +1,252 @@
+########################
+# 📌 SuffixIndex: build once, then answer `in` / count / find fast
+########################
+
+# basics.py slices `word` and takes len() of one long word. Asking
+# `pattern in text`, text.count(pattern) or "where does it occur?" over the
+# same large text millions of times means millions of O(n) scans. A suffix
+# array sorts every suffix of the text once; all suffixes starting with a
+# pattern then sit next to each other, so two binary searches find them:
+#
+#   - build           O(n log n)  prefix doubling + bucket sort, then
+#                                 Kasai's O(n) LCP array
+#   - in / count      O(m log n)  two binary searches (m = len(pattern))
+#   - find_all        O(m log n + k) for k occurrences
+#
+#     index = SuffixIndex(corpus)
+#     "needle" in index, index.count("needle"), index.find_all("needle")
+#     index.save("corpus.sfx")
+#     with SuffixIndex.load("corpus.sfx") as index:   # mmap, no rebuild
+#         index.count("needle")
+#
+# Works on str (positions are characters) and bytes (positions are bytes).
+
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain
+
+
+def _build(text):
+    """Suffix array and its inverse (rank) by prefix doubling."""
+    n = len(text)
+    sa = sorted(range(n), key=text.__getitem__)
+    rank = [0] * n
+    classes = 0
+    for prev, i in zip(sa, sa[1:]):
+        if text[i] != text[prev]:
+            classes += 1
+        rank[i] = classes
+    k = 1
+    while classes < n - 1:
+        # Order by the second half rank[i + k]: suffixes with an empty second
+        # half come first, then the current order shifted back by k. A stable
+        # bucket sort on the first half rank[i] finishes the 2k-prefix sort.
+        order = list(range(n - k, n))
+        order += [i - k for i in sa if i >= k]
+        buckets = [[] for _ in range(classes + 1)]
+        for i in order:
+            buckets[rank[i]].append(i)
+        sa = list(chain.from_iterable(buckets))
+        padded = rank + [-1] * k
+        new_rank = [0] * n
+        classes = 0
+        prev = sa[0]
+        for i in sa[1:]:
+            if padded[i] != padded[prev] or padded[i + k] != padded[prev + k]:
+                classes += 1
+            new_rank[i] = classes
+            prev = i
+        rank = new_rank
+        k *= 2
+    return sa, rank
+
+
+def _kasai(text, sa, rank):
+    """lcp[r] = longest common prefix of suffixes sa[r - 1] and sa[r]."""
+    n = len(text)
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if not r:
+            h = 0
+            continue
+        j = sa[r - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[r] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+########################
+# 💾 Index files
+########################
+
+# Layout (little-endian):
+#   header  b"SUFIDX", version u16, kind (b"s" str / b"b" bytes),
+#           typecode (b"I" u32 / b"Q" u64), 6 pad bytes, length u64  → 24 bytes
+#   text    bytes as-is; str as UTF-32-BE, whose byte order sorts like
+#           code points, so the mapped text compares without decoding
+#   pad     to a multiple of 8
+#   sa      length entries of the typecode
+#   lcp     length entries of the typecode
+# load() maps the file, so opening a multi-GB index costs nothing and only
+# the pages a query touches are read.
+
+_HEADER = struct.Struct("<6sHcc6xQ")
+_MAGIC = b"SUFIDX"
+_VERSION = 1
+_STR_CODEC = "utf-32-be"
+
+
+class SuffixIndex:
+    """Suffix array + LCP over a str or bytes, for repeated substring queries."""
+
+    def __init__(self, text):
+        if not isinstance(text, (str, bytes)):
+            raise TypeError(f"SuffixIndex needs str or bytes, not {type(text).__name__}")
+        self.kind = type(text)
+        self._length = len(text)
+        typecode = "I" if self._length <= 0xFFFFFFFF else "Q"
+        sa, rank = _build(text) if text else ([], [])
+        self.sa = array(typecode, sa)
+        self.lcp = array(typecode, _kasai(text, sa, rank))
+        self._data = text      # what queries slice...
+        self._offset = 0       # ...starting here...
+        self._width = 1        # ...with this many units per character
+        self._mmap = None
+
+    @classmethod
+    def load(cls, path) -> "SuffixIndex":
+        """Open a saved index read-only via mmap, without rebuilding it."""
+        if sys.byteorder != "little":
+            raise OSError("suffix index files are little-endian")
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, kind, typecode, length = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC or version != _VERSION:
+            mapped.close()
+            raise ValueError(f"{path!r} is not a version {_VERSION} suffix index")
+        self = cls.__new__(cls)
+        self.kind = str if kind == b"s" else bytes
+        self._length = length
+        self._width = 4 if self.kind is str else 1
+        self._data = mapped
+        self._offset = _HEADER.size
+        self._mmap = mapped
+        start = _HEADER.size + length * self._width
+        start += -start % 8
+        size = length * struct.calcsize(typecode.decode())
+        view = memoryview(mapped)
+        self.sa = view[start:start + size].cast(typecode.decode())
+        self.lcp = view[start + size:start + 2 * size].cast(typecode.decode())
+        view.release()
+        return self
+
+    def save(self, path) -> None:
+        typecode = "I" if self._length <= 0xFFFFFFFF else "Q"
+        text = self._text_bytes()
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, b"s" if self.kind is str else b"b",
+                                 typecode.encode(), self._length))
+            f.write(text)
+            f.write(b"\0" * (-(_HEADER.size + len(text)) % 8))
+            for column in (self.sa, self.lcp):
+                column = array(typecode, column)
+                if sys.byteorder != "little":
+                    column.byteswap()
+                column.tofile(f)
+
+    def _text_bytes(self) -> bytes:
+        if self._mmap is not None:
+            return self._data[self._offset:self._offset + self._length * self._width]
+        if self.kind is str:
+            return self._data.encode(_STR_CODEC, "surrogatepass")
+        return self._data
+
+    def _encode(self, pattern):
+        if not isinstance(pattern, self.kind):
+            raise TypeError(f"can't search a {self.kind.__name__} index "
+                            f"for {type(pattern).__name__}")
+        if self._width == 4:
+            return pattern.encode(_STR_CODEC, "surrogatepass")
+        return pattern
+
+    def _range(self, pattern):
+        """[lo, hi) of the suffix array rows starting with `pattern`."""
+        key = self._encode(pattern)
+        size = len(key)
+        data, sa, base, width = self._data, self.sa, self._offset, self._width
+        end = base + self._length * width  # a mapped text is followed by the arrays
+        lo, hi = 0, self._length
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + sa[mid] * width
+            if data[start:min(start + size, end)] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        first, hi = lo, self._length
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + sa[mid] * width
+            if data[start:min(start + size, end)] <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def __len__(self) -> int:
+        return self._length
+
+    # The empty pattern matches at every position including the end, as in str.
+
+    def __contains__(self, pattern) -> bool:
+        lo, hi = self._range(pattern)
+        return hi > lo or not pattern
+
+    def count(self, pattern) -> int:
+        """Occurrences of `pattern`, overlapping ones included (unlike str.count)."""
+        lo, hi = self._range(pattern)
+        return hi - lo if pattern else self._length + 1
+
+    def find_all(self, pattern) -> list:
+        """Every start position of `pattern`, ascending."""
+        lo, hi = self._range(pattern)
+        return sorted(self.sa[lo:hi]) if pattern else list(range(self._length + 1))
+
+    def find(self, pattern) -> int:
+        """Lowest start position of `pattern`, or -1, like str.find."""
+        lo, hi = self._range(pattern)
+        if not pattern:
+            return 0
+        return min(self.sa[lo:hi]) if hi > lo else -1
+
+    def longest_repeat(self):
+        """Longest substring that occurs at least twice (from the LCP array)."""
+        if not self._length:
+            return self.kind()
+        r = max(range(self._length), key=self.lcp.__getitem__)
+        start = self._offset + self.sa[r] * self._width
+        piece = self._data[start:start + self.lcp[r] * self._width]
+        if self._width == 4:
+            return piece.decode(_STR_CODEC, "surrogatepass")
+        return piece
+
+    def close(self) -> None:
+        """Release the mapping of a loaded index (no-op for a built one)."""
+        if self._mmap is not None:
+            self.sa.release()
+            self.lcp.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,134 @@
+########################
+# 📌 Work queues built on collections.deque
+########################
+
+# data_structure.py shows why `list.pop(0)` is a bad queue: every dequeue
+# shifts the whole list, O(n). deque pops from either end in O(1). These
+# classes add what a job runner needs on top: a capacity limit that pushes
+# back on producers, batch put/get, and a thread-safe variant.
+
+import threading
+import time
+from collections import deque
+from itertools import islice
+from queue import Empty, Full
+
+
+class WorkQueue:
+    """FIFO queue with an optional capacity, for use from a single thread.
+
+    put() raises queue.Full when the queue is at capacity and get() raises
+    queue.Empty when there is nothing to take, like queue.Queue's *_nowait.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize  # 0 means unbounded
+        self._items = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put(self, item) -> None:
+        if self.full():
+            raise Full
+        self._items.append(item)
+
+    def put_many(self, items) -> int:
+        """Enqueue as many items as fit; return how many were taken."""
+        if self.maxsize > 0:
+            items = list(islice(items, self.maxsize - len(self._items)))
+        before = len(self._items)
+        self._items.extend(items)
+        return len(self._items) - before
+
+    def get(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def get_many(self, n: int) -> list:
+        """Dequeue up to n items (fewer if the queue runs out)."""
+        popleft = self._items.popleft
+        return [popleft() for _ in range(min(n, len(self._items)))]
+
+
+class ThreadSafeWorkQueue(WorkQueue):
+    """WorkQueue guarded by one lock, with blocking put/get.
+
+    Producers block while the queue is full and consumers block while it is
+    empty; `timeout` (seconds) bounds the wait, after which queue.Full or
+    queue.Empty is raised.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        with self._not_full:
+            self._wait(self._not_full, self.full, block, timeout, Full)
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def put_many(self, items, block: bool = True, timeout: float = None) -> int:
+        """Enqueue items in order, waiting for room as needed; return the count.
+
+        With block=False, or once the timeout passes, only what fits is taken;
+        the rest of the sequence is items[count:].
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        start = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_full:
+            while True:
+                stop = len(items)
+                if self.maxsize > 0:
+                    stop = min(stop, start + self.maxsize - len(self._items))
+                if stop > start:
+                    self._items.extend(items[start:stop])
+                    self._not_empty.notify(stop - start)
+                    start = stop
+                if start == len(items):
+                    return start
+                remaining = None if deadline is None else deadline - time.monotonic()
+                try:
+                    self._wait(self._not_full, self.full, block, remaining, Full)
+                except Full:
+                    return start
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not self._items, block, timeout, Empty)
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, n: int, block: bool = True, timeout: float = None) -> list:
+        """Wait for at least one item, then take up to n without waiting more."""
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not self._items, block, timeout, Empty)
+            popleft = self._items.popleft
+            items = [popleft() for _ in range(min(n, len(self._items)))]
+            self._not_full.notify(len(items))
+            return items
+
+    @staticmethod
+    def _wait(condition, blocked, block, timeout, error) -> None:
+        # Called with the lock held; returns once `blocked()` is false.
+        if not blocked():
+            return
+        if not block or (timeout is not None and timeout <= 0):
+            raise error
+        if not condition.wait_for(lambda: not blocked(), timeout):
+            raise error
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def python():
+    """Run a fresh interpreter in the repo root: python("-c", code, VAR="1").
+
+    Keyword arguments become environment variables; any LEARN_PYTHON_INSTRUMENT*
+    already set is dropped first. stdin is closed unless `input` is given, so a
+    stray input() fails instead of hanging. Raises on a non-zero exit unless
+    check=False.
+    """
+    def run(*args, input=None, check=True, timeout=60, **env):
+        environ = {k: v for k, v in os.environ.items()
+                   if not k.startswith("LEARN_PYTHON_INSTRUMENT")}
+        environ.update(env)
+        stdin = {"input": input} if input is not None else {"stdin": subprocess.DEVNULL}
+        return subprocess.run([sys.executable, *args], cwd=ROOT, env=environ,
+                              capture_output=True, text=True, timeout=timeout,
+                              check=check, **stdin)
+    return run
+
+
+@pytest.fixture(params=[False, True], ids=["pure", "numpy"])
+def use_numpy(request, monkeypatch):
+    """Run a test on the pure-Python paths, then again on the NumPy ones."""
+    from learn_python import _optional
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(_optional, "use_numpy", request.param)
+    return request.param
@@ -0,0 +1,52 @@
+"""add() sums like the builtins, lazily, exactly, and across processes."""
+
+import math
+import random
+
+import pytest
+
+from learn_python.adder import add, add_iter, add_parallel
+
+
+def test_add_two_numbers_like_before():
+    assert add(2, 3) == 5
+    assert add() == 0
+    assert add(1.5) == 1.5
+
+
+def test_add_takes_an_iterable_without_unpacking(use_numpy):
+    assert add(x * x for x in range(1000)) == sum(x * x for x in range(1000))
+    assert add(range(10)) == 45
+    assert add([]) == 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_exact_matches_fsum(seed):
+    rng = random.Random(seed)
+    values = [rng.choice((1e16, -1e16, 1.0, 0.1, -0.1)) * rng.random()
+              for _ in range(5000)] + [1e100, 1.0, -1e100]
+    rng.shuffle(values)
+    assert add(values, exact=True) == math.fsum(values)
+    assert add_iter(iter(values), exact=True, chunk_size=7) == math.fsum(values)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 999, 1000, 1001])
+def test_chunk_boundaries(chunk_size, use_numpy):
+    values = list(range(1000))
+    assert add_iter(values, chunk_size=chunk_size) == 499_500
+    backend = "numpy" if use_numpy else "python"
+    assert add_iter(iter(values), backend=backend, chunk_size=chunk_size) == 499_500
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        add_iter([1], backend="gpu")
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_parallel_matches_serial(exact):
+    values = [random.Random(0).random() for _ in range(10_000)]
+    expected = add(values, exact=exact)
+    result = add_parallel(iter(values), workers=2, exact=exact, chunk_size=999)
+    assert result == expected if exact else math.isclose(result, expected)
+    assert add_parallel(range(10_000), workers=2, chunk_size=1000) == 49_995_000
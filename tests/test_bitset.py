@@ -0,0 +1,87 @@
+"""BitSet operators give the same answers as the built-in set."""
+
+import operator
+import random
+
+import pytest
+
+from learn_python.bitset import ASCII_LETTERS, BitSet, Universe
+
+UNIVERSE = Universe(range(70))  # wider than one machine word
+
+BINARY = [operator.or_, operator.and_, operator.sub, operator.xor]
+IN_PLACE = [operator.ior, operator.iand, operator.isub, operator.ixor]
+COMPARE = [operator.le, operator.lt, operator.ge, operator.gt, operator.eq, operator.ne]
+
+
+def _check(bitset, model):
+    assert set(bitset) == model
+    assert list(bitset) == sorted(model)  # universe order
+    assert len(bitset) == len(model)
+    assert bool(bitset) == bool(model)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_set_randomized(seed):
+    rng = random.Random(seed)
+
+    def sample():
+        elements = set(rng.sample(range(70), rng.randrange(0, 70)))
+        return UNIVERSE.bitset(elements), elements
+
+    for _ in range(200):
+        (a, sa), (b, sb) = sample(), sample()
+        if rng.random() < 0.2:
+            b, sb = a.copy(), set(sa)
+        for op in BINARY:
+            _check(op(a, b), op(sa, sb))
+        for op in COMPARE:
+            assert op(a, b) == op(sa, sb)
+        assert a.isdisjoint(b) == sa.isdisjoint(sb)
+        for op in IN_PLACE:
+            target, model = a.copy(), set(sa)
+            result = op(target, b)
+            assert result is target
+            _check(target, op(model, sb))
+        _check(a, sa)  # operands are never changed
+
+        element = rng.randrange(-2, 72)
+        assert (element in a) == (element in sa)
+        a.discard(element)
+        sa.discard(element)
+        _check(a, sa)
+        if element in range(70):
+            a.add(element)
+            sa.add(element)
+            _check(a, sa)
+            a.remove(element)
+            sa.remove(element)
+            _check(a, sa)
+        with pytest.raises(KeyError):
+            a.remove(element)
+        _check(a.filter(lambda x: x % 3 == 0), {x for x in sa if x % 3 == 0})
+
+
+def test_string_examples_match_data_structure():
+    a = ASCII_LETTERS.from_string("abracadabra")
+    b = ASCII_LETTERS.from_string("alacazam")
+    for op in BINARY:
+        assert set(op(a, b)) == op(set("abracadabra"), set("alacazam"))
+    assert repr(a - b) == "BitSet('bdr')"
+    assert ASCII_LETTERS.full() >= a and len(ASCII_LETTERS.full()) == 52
+
+
+def test_rejects_other_universes_and_types():
+    a = UNIVERSE.bitset([1, 2])
+    other = Universe(range(70)).bitset([1, 2])
+    assert a != other
+    for op in BINARY + IN_PLACE + COMPARE[:4]:
+        with pytest.raises(ValueError):
+            op(a.copy(), other)
+        with pytest.raises(TypeError):
+            op(a.copy(), {1, 2})
+    with pytest.raises(ValueError):
+        a.add(70)
+    with pytest.raises(ValueError):
+        Universe("aa")
+    assert BitSet(UNIVERSE) == UNIVERSE.bitset() and not BitSet(UNIVERSE)
@@ -0,0 +1,34 @@
+"""classify_statuses agrees with http_error for lists and NumPy arrays."""
+
+import random
+
+import pytest
+
+from learn_python.control_flow import HTTP_CATEGORIES, classify_statuses, http_error
+
+
+def _statuses(seed):
+    rng = random.Random(seed)
+    return [rng.choice((400, 401, 403, 404, 418, 500, 0, -1, 99, 600, 10**6))
+            if rng.random() < 0.5 else rng.randrange(-10, 700) for _ in range(2_000)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_http_error(seed):
+    statuses = _statuses(seed)
+    assert classify_statuses(statuses) == [http_error(s) for s in statuses]
+
+
+@pytest.mark.parametrize("dtype", ["int16", "int64", "uint16"])
+def test_integer_arrays_give_category_codes(dtype):
+    np = pytest.importorskip("numpy")
+    statuses = [s for s in _statuses(dtype) if 0 <= s < 2**15]
+    codes = classify_statuses(np.array(statuses, dtype=dtype))
+    assert codes.dtype == np.uint8
+    assert [HTTP_CATEGORIES[c] for c in codes] == [http_error(s) for s in statuses]
+
+
+def test_float_arrays_classify_like_http_error():
+    np = pytest.importorskip("numpy")
+    statuses = [404.0, 404.5, 418.0, 400.25, 1e300, -0.0, float("nan")]
+    assert classify_statuses(np.array(statuses)) == [http_error(s) for s in statuses]
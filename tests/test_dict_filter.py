@@ -0,0 +1,74 @@
+"""dict_filter helpers and SnapshotDict behave like a plain dict."""
+
+import random
+
+import pytest
+
+from learn_python.dict_filter import SnapshotDict, filter_in_place, partition
+
+
+def _keep(key, value):
+    return value % 3 != 0
+
+
+@pytest.mark.parametrize("size", [0, 1, 100])
+def test_filter_and_partition_match_comprehensions(size):
+    rng = random.Random(size)
+    users = {f"user{i}": rng.randrange(10) for i in range(size)}
+    kept = {k: v for k, v in users.items() if _keep(k, v)}
+    dropped = {k: v for k, v in users.items() if not _keep(k, v)}
+
+    copy = dict(users)
+    assert filter_in_place(copy, _keep) == len(dropped)
+    assert copy == kept
+    copy = dict(users)
+    assert partition(copy, _keep) == dropped
+    assert copy == kept
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_snapshot_dict_matches_dict_randomized(seed):
+    rng = random.Random(seed)
+    snap, model = SnapshotDict(), {}
+    readers = []  # (iterator, snapshot of the model when it started, seen so far)
+    for step in range(3_000):
+        op = rng.randrange(6)
+        key = rng.randrange(30)
+        if op <= 1:
+            snap[key] = model[key] = step
+        elif op == 2:
+            if key in model:
+                del snap[key], model[key]
+            else:
+                with pytest.raises(KeyError):
+                    del snap[key]
+        elif op == 3 and len(readers) < 3:
+            # the snapshot is taken when the generator starts, not at items()
+            items = snap.items()
+            seen = [next(items)] if model else list(items)
+            readers.append((items, dict(model), seen))
+        elif readers:
+            reader = rng.choice(readers)
+            items, expected, seen = reader
+            for pair in items:
+                seen.append(pair)
+                if rng.random() < 0.2:
+                    break
+            else:
+                assert len(seen) == len(expected)
+                assert dict(seen) == expected
+                readers.remove(reader)
+        assert len(snap) == len(model)
+        assert snap.get(key) == model.get(key)
+        assert (key in snap) == (key in model)
+    for items, expected, seen in readers:
+        seen.extend(items)
+        assert dict(seen) == expected
+    assert dict(snap.items()) == model
+    assert not snap._updated and not snap._deleted  # overlay folded back in
+
+
+def test_filter_in_place_method():
+    snap = SnapshotDict({i: i for i in range(10)})
+    assert snap.filter_in_place(_keep) == 4
+    assert dict(snap.items()) == {i: i for i in range(10) if i % 3}
@@ -0,0 +1,98 @@
+"""Importing learn_python must stay cheap and free of side effects."""
+
+import compileall
+import os
+
+import pytest
+
+import learn_python
+
+RUNS = 5
+
+# Cold import in a fresh interpreter, best of RUNS, in ms. Most of what the
+# exports cost is stdlib the tutorials use anyway (collections for
+# namedtuple, enum for control_flow's Color); the helpers themselves add
+# little. Measured around 1, 9, 4, 3 and 4 ms.
+IMPORT_BUDGETS_MS = {
+    "import learn_python": 3.0,
+    "from learn_python import http_error, Point": 15.0,
+    "from learn_python import nForest": 8.0,
+    "from learn_python import add": 8.0,
+    "from learn_python import Router, memoize, is_prime, BitSet": 15.0,
+}
+
+TUTORIALS = ("basics", "control_flow", "data_structure", "pattern")
+
+
+@pytest.fixture(scope="module")
+def compiled():
+    # Time imports from up-to-date .pyc files, as every run after the first
+    # sees them, even where PYTHONDONTWRITEBYTECODE is set.
+    compileall.compile_dir(os.path.dirname(learn_python.__file__), quiet=1)
+
+
+@pytest.mark.parametrize("statement", IMPORT_BUDGETS_MS)
+def test_cold_import_within_budget(python, compiled, statement):
+    code = (
+        "import time\n"
+        "t = time.perf_counter_ns()\n"
+        f"{statement}\n"
+        "print((time.perf_counter_ns() - t) / 1e6)\n"
+    )
+    best = min(float(python("-c", code).stdout) for _ in range(RUNS))
+    budget = IMPORT_BUDGETS_MS[statement]
+    assert best < budget, f"{statement} took {best:.2f} ms (budget {budget} ms)"
+
+
+def test_package_import_loads_no_submodules(python):
+    code = (
+        "import sys, learn_python\n"
+        "print(sorted(m for m in sys.modules if m.startswith('learn_python.')))\n"
+    )
+    assert python("-c", code).stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("name", TUTORIALS)
+def test_tutorial_import_is_silent(python, name):
+    result = python("-c", f"import learn_python.{name}")
+    assert result.stdout == ""
+
+
+def test_lazy_export_imports_only_its_module(python):
+    code = (
+        "import sys\n"
+        "from learn_python import http_error, nForest\n"
+        "print(http_error(418))\n"
+        "print(sorted(m for m in sys.modules if m.startswith('learn_python.')))\n"
+    )
+    out = python("-c", code).stdout.splitlines()
+    assert out[0] == "I'm a teapot"
+    assert out[1] == ("['learn_python._optional', 'learn_python.control_flow', "
+                      "'learn_python.instrument', 'learn_python.pattern', "
+                      "'learn_python.sinks']")
+
+
+def test_export_wins_over_its_submodule_name(python):
+    code = (
+        "from learn_python import memoize, phone_book\n"
+        "print(memoize.__module__, callable(memoize), phone_book.__name__)\n"
+    )
+    assert python("-c", code).stdout.split() == [
+        "learn_python.memoize", "True", "learn_python.phone_book"]
+
+
+def test_runner_plays_examples(python):
+    result = python("-m", "learn_python", "pattern")
+    assert result.stdout.startswith(" " * 18 + "* \n")
+
+
+def test_runner_without_arguments_plays_every_tutorial(python):
+    result = python("-m", "learn_python", input="5\n", timeout=120)
+    assert "Please enter an integer: More" in result.stdout  # control_flow
+    assert result.stdout.rstrip("\n").endswith("9 " * 17)     # pattern, last
+
+
+def test_runner_rejects_unknown_tutorial(python):
+    result = python("-m", "learn_python", "nope", check=False)
+    assert result.returncode == 2
+    assert "unknown tutorial" in result.stderr
@@ -0,0 +1,44 @@
+"""@instrumented is free when disabled and records calls when enabled."""
+
+import json
+
+
+def test_disabled_leaves_functions_untouched(python):
+    out = python(
+        "-c",
+        "from learn_python import control_flow, pattern, instrument\n"
+        "print(hasattr(pattern.printC, '__wrapped__'),"
+        " hasattr(control_flow.where_is, '__wrapped__'), instrument.snapshot())\n"
+    ).stdout
+    assert out.strip() == "False False {}"
+
+
+def test_enabled_records_calls_and_dumps(python, tmp_path):
+    path = tmp_path / "stats.json"
+    out = python(
+        "-c",
+        "import io, json\n"
+        "from learn_python import control_flow, instrument, sinks\n"
+        "sinks.set_sink(sinks.StreamSink(io.StringIO()))\n"
+        "for y in range(10):\n"
+        "    control_flow.where_is(control_flow.Point(0, y))\n"
+        "control_flow.http_error(418)\n"
+        "print(json.dumps(instrument.snapshot()))\n",
+        LEARN_PYTHON_INSTRUMENT="1",
+        LEARN_PYTHON_INSTRUMENT_DUMP=str(path),
+    ).stdout
+    stats = json.loads(out)
+    where_is = stats["learn_python.control_flow.where_is"]
+    assert where_is["count"] == 10
+    assert 0 < where_is["p50_ns"] <= where_is["p99_ns"]
+    assert where_is["total_ns"] > 0
+    # the lookup tables built at import do not count as calls
+    assert stats["learn_python.control_flow.http_error"]["count"] == 1
+    # the final dump runs at exit
+    assert json.loads(path.read_text())["functions"] == stats
+
+
+def test_dump_works_when_disabled(python, tmp_path):
+    path = tmp_path / "stats.json"
+    python("-c", f"from learn_python import instrument\ninstrument.dump({str(path)!r})\n")
+    assert json.loads(path.read_text())["functions"] == {}
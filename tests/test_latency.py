@@ -0,0 +1,46 @@
+"""Histogram percentiles are measured durations, not power-of-two bounds."""
+
+import random
+
+from learn_python import latency
+from learn_python.latency import Histogram
+
+
+def _nearest_rank(values, p):
+    ordered = sorted(values)
+    return ordered[max(1, -(-len(ordered) * p // 100)) - 1]
+
+
+def test_exact_while_the_sample_holds_everything():
+    rng = random.Random(0)
+    values = [rng.randrange(1, 10**6) for _ in range(latency.SAMPLE_SIZE)]
+    h = Histogram()
+    for ns in values:
+        h.record(ns)
+    for p in (1, 50, 90, 99, 100):
+        assert h.percentile(p) == _nearest_rank(values, p)
+    assert h.summary() == {
+        "count": len(values),
+        "mean_ns": sum(values) // len(values),
+        "p50_ns": _nearest_rank(values, 50),
+        "p99_ns": _nearest_rank(values, 99),
+    }
+    assert sum(h.buckets) == len(values)
+
+
+def test_not_rounded_up_to_a_bucket_bound():
+    h = Histogram()
+    for ns in range(1, 1001):
+        h.record(ns)
+    assert (h.percentile(50), h.percentile(99)) == (500, 990)  # not 512, 1024
+
+
+def test_sample_stays_bounded_and_representative():
+    h = Histogram()
+    for ns in range(100_000):
+        h.record(ns)
+    assert len(h._sample) == latency.SAMPLE_SIZE
+    assert h.count == 100_000
+    assert 40_000 < h.percentile(50) < 60_000
+    assert h.percentile(99) > 95_000
+    assert Histogram().summary()["p99_ns"] == 0
@@ -0,0 +1,49 @@
+"""Matrix transposes agree with zip(*rows), with and without NumPy."""
+
+import random
+
+import pytest
+
+from learn_python.matrix import Matrix
+
+
+def _rows(rng, n, m):
+    return [[rng.uniform(-1e6, 1e6) for _ in range(m)] for _ in range(n)]
+
+
+@pytest.mark.parametrize("shape", [(0, 0), (1, 1), (1, 7), (7, 1), (5, 9), (33, 17)])
+@pytest.mark.parametrize("tile", [1, 4, 256])
+def test_transpose_matches_zip(use_numpy, shape, tile):
+    rows = _rows(random.Random(str(shape)), *shape)
+    expected = [list(column) for column in zip(*rows)]
+    matrix = Matrix.from_rows(rows)
+    assert matrix.T.tolist() == expected
+    transposed = matrix.transpose(tile)
+    assert transposed.tolist() == expected
+    assert transposed.is_contiguous() and transposed.shape == shape[::-1]
+    assert transposed.transpose(tile).tolist() == rows
+    assert matrix.T.T.tolist() == rows
+
+
+def test_view_shares_data_and_copy_does_not(use_numpy):
+    matrix = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    view, copy = matrix.T, matrix.transpose()
+    matrix.data[1] = 20
+    assert view[1, 0] == 20 and copy[1, 0] == 2
+    assert [view[j, i] for i in range(2) for j in range(3)] == list(matrix.data)
+
+
+def test_copy_of_a_strided_view(use_numpy):
+    rows = _rows(random.Random(0), 6, 8)
+    # every other column of the transpose: a view with non-unit strides
+    view = Matrix(4, 6, Matrix.from_rows(rows).data, strides=(2, 8), offset=1)
+    expected = [[rows[i][2 * j + 1] for i in range(6)] for j in range(4)]
+    assert view.tolist() == expected
+    assert view.copy(tile=3).tolist() == expected
+
+
+def test_bad_input():
+    with pytest.raises(ValueError):
+        Matrix.from_rows([[1, 2], [3]])
+    with pytest.raises(IndexError):
+        Matrix.from_rows([[1]])[1, 0]
@@ -0,0 +1,85 @@
+"""memoize caches like an LRU/TTL dict keyed by argument structure."""
+
+import random
+import time
+from collections import OrderedDict
+
+import pytest
+
+from learn_python.memoize import memoize
+
+
+@pytest.mark.parametrize("maxsize", [1, 4, None])
+def test_lru_matches_model_randomized(maxsize):
+    rng = random.Random(maxsize)
+    calls = []
+
+    @memoize(maxsize=maxsize)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    model = OrderedDict()
+    for _ in range(2_000):
+        x = rng.randrange(8)
+        expected_call = x not in model
+        before = len(calls)
+        assert square(x) == x * x
+        assert (len(calls) > before) == expected_call
+        model[x] = True
+        model.move_to_end(x)
+        if maxsize is not None and len(model) > maxsize:
+            model.popitem(last=False)
+    info = square.cache_info()
+    assert info.misses == len(calls) and info.hits == 2_000 - len(calls)
+    assert info.currsize == len(model)
+
+
+def test_unhashable_arguments_and_fresh_results():
+    calls = []
+
+    @memoize()
+    def good_func(x, arr=None):
+        calls.append(x)
+        return (arr or []) + [x]
+
+    first = good_func(1, arr=[{"a": {1, 2}}])
+    first.append("caller's own change")
+    assert good_func(1, arr=[{"a": {2, 1}}]) == [{"a": {1, 2}}, 1]
+    assert good_func(1, arr=[{"a": {1}}]) == [{"a": {1}}, 1]
+    assert calls == [1, 1]
+
+
+def test_ttl_expires_entries():
+    calls = []
+
+    @memoize(ttl=0.05)
+    def now(x):
+        calls.append(x)
+        return len(calls)
+
+    assert now("a") == now("a") == 1
+    time.sleep(0.1)
+    assert now("a") == 2
+
+
+def test_results_persist_across_runs(tmp_path):
+    path = str(tmp_path / "results")
+    calls = []
+
+    def slow(x, options=None):
+        calls.append(x)
+        return {"x": x, "options": options}
+
+    cached = memoize(path=path)(slow)
+    assert cached(3, options={"fast": False}) == {"x": 3, "options": {"fast": False}}
+    cached.close()
+
+    again = memoize(path=path)(slow)  # a new process would start like this
+    assert again(3, options={"fast": False}) == {"x": 3, "options": {"fast": False}}
+    assert calls == [3]
+    assert again.cache_info().hits == 1
+    again.cache_clear()
+    again(3, options={"fast": False})
+    assert calls == [3, 3]
+    again.close()
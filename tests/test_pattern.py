@@ -0,0 +1,45 @@
+"""Every backend writes the same text to any object with write(str)."""
+
+import io
+
+import pytest
+
+from learn_python import pattern
+
+
+class _Writer:
+    """Duck-typed text target: write(str) and nothing else."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, s):
+        assert isinstance(s, str)
+        self.parts.append(s)
+
+
+def _render(write, n, backend, file):
+    write(n, file=file, backend=backend)
+    return file.getvalue() if isinstance(file, io.StringIO) else "".join(file.parts)
+
+
+@pytest.mark.parametrize("write", [pattern.write_nForest, pattern.write_printC])
+@pytest.mark.parametrize("n", [0, 1, 2, 9, 12])
+def test_backends_agree_on_any_text_writer(write, n):
+    expected = _render(write, n, "python", io.StringIO())
+    assert _render(write, n, "python", _Writer()) == expected
+    pytest.importorskip("numpy")
+    assert _render(write, n, "numpy", io.StringIO()) == expected
+    assert _render(write, n, "numpy", _Writer()) == expected
+
+
+def test_cache_is_opt_in_and_bounded():
+    expected = {n: _render(pattern.write_printC, n, "python", io.StringIO()) for n in (3, 20)}
+    assert pattern.row_cache.info().misses == 0  # never used unless passed in
+    cache = pattern.RowCache(maxsize=100, maxbytes=200)
+    for n in (3, 3, 20, 20):
+        out = io.StringIO()
+        pattern.write_printC(n, file=out, cache=cache)
+        assert out.getvalue() == expected[n]
+        assert cache.info().currbytes <= 200
+    assert cache.info().hits >= 6  # the second small render came from the cache
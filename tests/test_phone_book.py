@@ -0,0 +1,56 @@
+"""PhoneBook behaves like a dict, across deletes, compaction and save/load."""
+
+import random
+
+import pytest
+
+from learn_python.phone_book import PhoneBook
+
+
+def test_matches_dict_randomized(tmp_path):
+    rng = random.Random(14)
+    book, expected = PhoneBook(), {}
+    names = [f"name{i}" for i in range(3000)] + ["Éléonore", "景太郎", ""]
+    for step in range(20_000):
+        name = rng.choice(names)
+        if rng.random() < 0.3 and name in expected:
+            del book[name]
+            del expected[name]
+        else:
+            number = rng.randrange(-2**63, 2**63)
+            book[name] = number
+            expected[name] = number
+        if step % 5000 == 4999:
+            path = tmp_path / f"book{step}.bin"
+            book.save(path)
+            book = PhoneBook.load(path)
+        assert len(book) == len(expected)
+    assert list(book) == list(expected)
+    assert dict(book.items()) == expected
+    assert all(name in book for name in expected)
+    assert sum(name in book for name in names) == len(expected)
+
+
+@pytest.mark.parametrize("bad, error", [(2**70, OverflowError), ("555-1234", TypeError)])
+def test_rejected_number_leaves_book_intact(bad, error):
+    book = PhoneBook({"jack": 4098})
+    with pytest.raises(error):
+        book["sape"] = bad
+    with pytest.raises(error):
+        book["jack"] = bad
+    book["guido"] = 4127
+    assert list(book) == ["jack", "guido"]
+    assert "guido" in book and "sape" not in book
+    assert dict(book.items()) == {"jack": 4098, "guido": 4127}
+
+
+@pytest.mark.parametrize("key", [4098, b"jack", None, ("jack",)])
+def test_non_str_keys_are_missing_like_in_a_dict(key):
+    book = PhoneBook({"jack": 4098})
+    assert key not in book
+    assert book.get(key, "none") == "none"
+    with pytest.raises(KeyError):
+        book[key]
+    with pytest.raises(KeyError):
+        del book[key]
+    assert dict(book.items()) == {"jack": 4098}
@@ -0,0 +1,120 @@
+"""where_is_bulk and point files classify points exactly like where_is."""
+
+import math
+import random
+
+import pytest
+
+from learn_python import points as points_module
+from learn_python import sinks
+from learn_python.control_flow import Point, where_is
+from learn_python.points import (CATEGORIES, PointArray, PointFile, save_points,
+                                 where_is_bulk, where_is_file)
+
+SPECIAL = (0.0, -0.0, math.nan, math.inf, -1.5, 3.0)
+
+
+def _where_is_category(x, y):
+    ring = sinks.RingBufferSink()
+    previous = sinks.set_sink(ring)
+    try:
+        where_is(Point(x, y))
+    finally:
+        sinks.set_sink(previous)
+    line, = ring.drain()
+    if line == "Origin\n":
+        return "origin"
+    if line.startswith("Y="):
+        return "y_axis"
+    if line.startswith("X="):
+        return "x_axis"
+    return "elsewhere"
+
+
+def _coords(seed, count=500):
+    rng = random.Random(seed)
+    return [(rng.choice(SPECIAL) if rng.random() < 0.7 else rng.uniform(-1, 1),
+             rng.choice(SPECIAL) if rng.random() < 0.7 else rng.uniform(-1, 1))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_bulk_matches_where_is(use_numpy, seed):
+    coords = _coords(seed)
+    counts, masks = where_is_bulk(PointArray(*zip(*coords)))
+    expected = [_where_is_category(x, y) for x, y in coords]
+    for name in CATEGORIES:
+        assert [bool(flag) for flag in masks[name]] == [c == name for c in expected]
+        assert counts[name] == expected.count(name)
+
+
+def test_signed_zero_and_nan(use_numpy):
+    points = PointArray([0.0, -0.0, math.nan, -0.0], [-0.0, math.nan, 0.0, 2.0])
+    counts, _ = where_is_bulk(points)
+    assert counts == {"origin": 1, "y_axis": 2, "x_axis": 1, "elsewhere": 0}
+    assert counts["y_axis"] == sum(_where_is_category(*p) == "y_axis" for p in points)
+
+
+def test_empty(use_numpy):
+    counts, _ = where_is_bulk(PointArray())
+    assert counts == dict.fromkeys(CATEGORIES, 0)
+
+
+@pytest.mark.parametrize("typecode", ["d", "i"])
+def test_point_file_round_trip(use_numpy, typecode, tmp_path):
+    coords = [(x, y) for x in range(-2, 3) for y in range(-2, 3)] * 7
+    points = PointArray(*zip(*coords))
+    path = tmp_path / "points.bin"
+    save_points(path, points, typecode)
+    with PointFile(path) as mapped:
+        assert len(mapped) == len(coords)
+        assert list(zip(mapped.xs, mapped.ys)) == coords
+    assert where_is_file(path, chunk_size=6) == where_is_bulk(points)[0]
+
+
+def _mmaps(monkeypatch):
+    created = []
+    real = points_module.mmap.mmap
+
+    def tracking(*args, **kwargs):
+        created.append(real(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(points_module.mmap, "mmap", tracking)
+    return created
+
+
+@pytest.mark.parametrize("cut", [4, 8, 8 * 35])
+def test_truncated_file_is_rejected_and_unmapped(cut, tmp_path, monkeypatch):
+    path = tmp_path / "points.bin"
+    save_points(path, PointArray(range(35), range(35)))
+    path.write_bytes(path.read_bytes()[:-cut])
+    created = _mmaps(monkeypatch)
+    with pytest.raises(ValueError, match="truncated"):
+        PointFile(path)
+    assert created and created[0].closed
+
+
+def test_unknown_typecode_is_rejected(tmp_path, monkeypatch):
+    path = tmp_path / "points.bin"
+    save_points(path, PointArray([1], [2]))
+    data = bytearray(path.read_bytes())
+    data[8:9] = b"f"  # the typecode byte follows magic and version
+    path.write_bytes(bytes(data))
+    created = _mmaps(monkeypatch)
+    with pytest.raises(ValueError, match="typecode"):
+        PointFile(path)
+    assert created[0].closed
+
+
+def test_error_inside_where_is_file_is_not_masked(tmp_path, monkeypatch):
+    path = tmp_path / "points.bin"
+    save_points(path, PointArray([0, 1], [1, 0]))
+
+    def failing(chunk):
+        held = memoryview(chunk.xs)  # alive in the traceback, like a NumPy view
+        raise RuntimeError(f"bad chunk of {len(held)}")
+
+    monkeypatch.setattr(points_module, "where_is_bulk", failing)
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        where_is_file(path)
@@ -0,0 +1,62 @@
+"""The sieve agrees with the trial-division loop from control_flow.py."""
+
+import random
+
+import pytest
+
+from learn_python.primes import factor_report, is_prime, iter_factors, iter_primes
+
+
+def _smallest_factor(n):
+    # The loop-`else` example: None when no x in 2..n-1 divides n.
+    for x in range(2, n):
+        if n % x == 0:
+            return x
+    return None
+
+
+def _smallest_factor_upto_sqrt(n):
+    x = 2
+    while x * x <= n:
+        if n % x == 0:
+            return x
+        x += 1
+    return None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_trial_division_randomized(seed):
+    rng = random.Random(seed)
+    for _ in range(20):
+        lo = rng.randrange(0, 3000)
+        hi = lo + rng.randrange(0, 500)
+        segment_size = rng.choice((1, 2, 7, 64, None))
+        expected = [(n, _smallest_factor(n)) for n in range(max(lo, 2), hi)]
+        assert list(iter_factors(lo, hi, segment_size)) == expected
+        assert list(iter_primes(lo, hi, segment_size)) == \
+            [n for n, x in expected if x is None]
+
+
+def test_is_prime():
+    assert [n for n in range(200) if is_prime(n)] == \
+        [n for n in range(2, 200) if _smallest_factor(n) is None]
+    rng = random.Random(0)
+    for n in (rng.randrange(1 << 20, 1 << 22) for _ in range(300)):
+        assert is_prime(n) == (_smallest_factor_upto_sqrt(n) is None), n
+    assert is_prime(2**61 - 1) and is_prime(2**89 - 1)
+    # a Carmichael number and a strong pseudoprime to bases 2..23
+    assert not any(map(is_prime, (1_050_985_330_177, 3_825_123_056_546_413_051)))
+
+
+def test_factor_report_lines(capsys):
+    factor_report(2, 10)
+    assert capsys.readouterr().out.splitlines()[:3] == [
+        "2 is a prime number", "3 is a prime number", "4 equals 2 * 2"]
+
+
+@pytest.mark.parametrize("lo, hi, segment_size",
+                         [(0, 5000, 333), (1, 2, 8), (9_990, 20_011, 1 << 12)])
+def test_parallel_matches_serial(lo, hi, segment_size):
+    assert list(iter_primes(lo, hi, segment_size, workers=2)) == list(iter_primes(lo, hi))
+    assert list(iter_factors(lo, hi, segment_size, workers=2)) == \
+        list(iter_factors(lo, hi))
@@ -0,0 +1,86 @@
+"""Rope edits give the same text as the str/bytes edits they replace."""
+
+import random
+
+import pytest
+
+from learn_python import rope as rope_module
+from learn_python.rope import Rope
+
+
+@pytest.fixture(autouse=True)
+def tiny_leaves(monkeypatch):
+    # Without merging, every edit adds leaves, so the tree actually gets deep.
+    monkeypatch.setattr(rope_module, "LEAF_MERGE", 2)
+
+
+def _contents(rope):
+    # Join the leaves by hand: flatten() would cache and collapse the tree.
+    return rope.kind()[:0].join(rope.chunks())
+
+
+def _check_balanced(node):
+    """AVL invariant on every node; returns the height it recomputed."""
+    if not node.height:
+        return 0
+    left, right = _check_balanced(node.left), _check_balanced(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == max(left, right) + 1
+    assert node.length == node.left.length + node.right.length
+    return node.height
+
+
+@pytest.mark.parametrize("kind", [str, bytes])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_str_randomized(kind, seed):
+    rng = random.Random(seed)
+
+    def text(n):
+        s = "".join(rng.choice("abcdefgh") for _ in range(n))
+        return s if kind is str else s.encode()
+
+    start = text(200)
+    rope, model = Rope(start), start
+    for _ in range(1_500):
+        op = rng.randrange(7)
+        i, j = sorted(rng.randrange(-5, len(model) + 5) for _ in range(2))
+        piece = text(rng.randrange(6))
+        if op == 0:
+            rope, model = rope + piece, model + piece
+        elif op == 1:
+            rope, model = piece + rope, piece + model
+        elif op == 2:
+            rope, model = rope.splice(i, j, piece), model[:i] + piece + model[j:]
+        elif op == 3:
+            rope, model = rope.splice(i, j), model[:i] + model[j:]
+        elif op == 4:
+            # slice then stitch back, the basics.py `word[:2] + word[2:]`
+            rope, model = rope[:i] + Rope(piece) + rope[i:], model[:i] + piece + model[i:]
+        elif op == 5 and len(model) < 5_000:
+            times = rng.randrange(3)
+            rope, model = rope[i:j] * times + rope, model[i:j] * times + model
+        elif model:
+            k = rng.randrange(-len(model), len(model))
+            assert rope[k] == model[k]
+            assert rope[i:j] == model[i:j]
+            assert rope[i:j:2] == model[i:j:2]
+        assert len(rope) == len(model)
+        if not model:
+            rope, model = Rope(start), start
+    assert _contents(rope) == model
+    _check_balanced(rope._root)
+    assert rope.depth <= 2 * max(1, sum(1 for _ in rope.chunks())).bit_length()
+    assert list(rope) == list(model)
+    assert rope == Rope(model) and hash(rope) == hash(model)
+    assert rope.flatten() == model and rope.depth == 0
+
+
+def test_kinds_do_not_mix():
+    with pytest.raises(TypeError):
+        Rope("text") + b"bytes"
+    with pytest.raises(TypeError):
+        Rope(b"bytes").splice(0, 0, "text")
+    with pytest.raises(TypeError):
+        bytes(Rope("text"))
+    with pytest.raises(IndexError):
+        Rope("abc")[3]
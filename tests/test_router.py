@@ -0,0 +1,71 @@
+"""Router: handler checks at registration, and no lost events on flush."""
+
+import pytest
+
+from learn_python.router import Router
+
+
+def test_failing_handler_does_not_drop_other_kinds():
+    router = Router()
+    seen = {"a": [], "b": []}
+
+    @router.route("a")
+    def on_a(x):
+        if x == 1:
+            raise RuntimeError("boom")
+        seen["a"].append(x)
+
+    @router.route("b", batch=True)
+    def on_b(events):
+        seen["b"].extend(event.args[0] for event in events)
+
+    for x in range(4):
+        router.submit("a", x)
+        router.submit("b", x)
+    with pytest.raises(RuntimeError):
+        router.flush()
+    assert seen == {"a": [0], "b": [0, 1, 2, 3]}
+    router.flush()  # the events after the one that raised were re-queued
+    assert seen == {"a": [0, 2, 3], "b": [0, 1, 2, 3]}
+
+
+def test_report_counts_calls_and_events():
+    router = Router()
+    router.add_route("one", lambda: None)
+    router.add_route("many", lambda events: None, batch=True)
+    for _ in range(5):
+        router.submit("one")
+        router.submit("many")
+    router.flush()
+    report = router.report()
+    assert (report["one"]["count"], report["one"]["events"]) == (5, 5)
+    assert (report["many"]["count"], report["many"]["events"]) == (1, 5)
+
+
+def test_kind_is_passed_only_when_asked():
+    router = Router()
+    calls = []
+    router.add_route("apple", lambda kind, *args, **kwargs: calls.append((kind, args, kwargs)),
+                     pass_kind=True)
+    router.add_route("pear", lambda kind=None, *args: calls.append((kind, args)))
+    router.dispatch("apple", 1, 2, color="red")
+    router.dispatch("pear", 1, 2)
+    assert calls == [("apple", (1, 2), {"color": "red"}), (1, (2,))]
+
+
+@pytest.mark.parametrize("handler, options", [
+    (lambda: None, {"batch": True}),
+    (lambda a, b: None, {"batch": True}),
+    (lambda: None, {"pass_kind": True}),
+    (lambda *, kind: None, {"pass_kind": True}),
+])
+def test_incompatible_handlers_are_rejected_at_registration(handler, options):
+    router = Router()
+    with pytest.raises(TypeError):
+        router.add_route("k", handler, **options)
+    assert not router._routes
+
+
+def test_batch_handlers_cannot_ask_for_kind():
+    with pytest.raises(ValueError):
+        Router().add_route("k", lambda events: None, batch=True, pass_kind=True)
@@ -0,0 +1,77 @@
+"""Streaming stats over float64 chunks agree with the statistics module."""
+
+import math
+import random
+import statistics
+from array import array
+
+import pytest
+
+from learn_python.sensor_stats import RunningStats, drop_nans, read_chunks, summarize
+
+
+class _Trickle:
+    """Binary source handing out a few bytes per read, so float64s split."""
+
+    def __init__(self, data: bytes, rng, method="readinto"):
+        self._data = memoryview(data)
+        self._pos = 0
+        self._rng = rng
+        setattr(self, method, self._read_into)
+
+    def _read_into(self, buffer) -> int:
+        n = min(len(buffer), self._rng.randrange(1, 20), len(self._data) - self._pos)
+        buffer[:n] = self._data[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+
+def _values(seed, count=3_000):
+    rng = random.Random(seed)
+    return [math.nan if rng.random() < 0.1 else rng.gauss(20.0, 5.0)
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("method", ["readinto", "recv_into"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_read_chunks_reassembles_split_floats(method, chunk_size):
+    values = _values(chunk_size)
+    source = _Trickle(array("d", values).tobytes(), random.Random(1), method)
+    got = [v for chunk in read_chunks(source, chunk_size) for v in chunk]
+    assert len(got) == len(values)
+    assert all(a == b or (math.isnan(a) and math.isnan(b)) for a, b in zip(got, values))
+
+
+def test_read_chunks_rejects_a_partial_float():
+    source = _Trickle(array("d", [1.0, 2.0]).tobytes()[:-3], random.Random(0))
+    with pytest.raises(ValueError, match="middle of a float64"):
+        list(read_chunks(source, 4))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_running_stats_match_statistics(use_numpy, seed):
+    values = _values(seed)
+    clean = [v for v in values if not math.isnan(v)]
+    source = _Trickle(array("d", values).tobytes(), random.Random(seed))
+
+    streamed = RunningStats()
+    for chunk in drop_nans(read_chunks(source, 97)):
+        streamed.update_many(chunk)
+    one_by_one = RunningStats()
+    for v in clean:
+        one_by_one.update(v)
+
+    for stats in (streamed, one_by_one, summarize(array("d", values), 50)):
+        assert stats.count == len(clean)
+        assert math.isclose(stats.mean, statistics.fmean(clean), rel_tol=1e-12)
+        assert math.isclose(stats.variance, statistics.variance(clean), rel_tol=1e-9)
+        assert math.isclose(stats.pvariance, statistics.pvariance(clean), rel_tol=1e-9)
+        assert (stats.min, stats.max) == (min(clean), max(clean))
+
+
+def test_too_few_values():
+    stats = RunningStats()
+    assert math.isnan(stats.variance) and math.isnan(stats.pvariance)
+    stats.update_many([])
+    stats.update(3.0)
+    assert stats.count == 1 and stats.pvariance == 0 and math.isnan(stats.variance)
@@ -0,0 +1,99 @@
+"""BatchedSink loses nothing: not to racing writers, not at interpreter exit."""
+
+import io
+import threading
+
+import pytest
+
+from learn_python.sinks import BatchedSink, Record
+
+
+def _record(i):
+    return Record(0.0, None, str(i), {})
+
+
+def test_flush_sees_every_write_from_many_threads():
+    out = io.StringIO()
+    sink = BatchedSink(out, max_batch=7, interval=0.001)
+
+    def writer(base):
+        for i in range(base, base + 2_000):
+            sink.write(_record(i))
+            if i % 250 == 0:
+                sink.flush()
+
+    threads = [threading.Thread(target=writer, args=(k * 2_000,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    sink.flush()
+    assert sorted(map(int, out.getvalue().split())) == list(range(16_000))
+    sink.close()
+
+
+def test_close_is_idempotent_and_refuses_later_writes():
+    out = io.StringIO()
+    sink = BatchedSink(out, interval=10)
+    sink.write(_record("last"))
+    sink.close()
+    sink.close()
+    assert out.getvalue() == "last\n"
+    with pytest.raises(ValueError):
+        sink.write(_record("late"))
+
+
+def test_queued_records_are_written_at_exit(python):
+    code = (
+        "from learn_python import sinks\n"
+        "sinks.set_sink(sinks.BatchedSink(interval=60))\n"
+        "for i in range(1000):\n"
+        "    sinks.emit(i)\n"
+    )
+    out = python("-c", code).stdout
+    assert out.split() == [str(i) for i in range(1000)]
+
+
+class _BrokenFile:
+    def write(self, s):
+        raise OSError("disk full")
+
+    def flush(self):
+        pass
+
+
+def test_failing_file_surfaces_the_error_instead_of_hanging():
+    sink = BatchedSink(_BrokenFile(), interval=0.001)
+    sink.write(_record(1))
+    errors = []
+
+    def flush():
+        try:
+            sink.flush()
+        except OSError as exc:
+            errors.append(exc)
+
+    flusher = threading.Thread(target=flush)
+    flusher.start()
+    flusher.join(10)
+    assert not flusher.is_alive(), "flush() hung after the file failed"
+    assert str(errors[0]) == "disk full"
+    assert sink._thread.is_alive()  # the writer survived the error
+    with pytest.raises(OSError):
+        sink.write(_record(2))  # no silent queueing into the void
+    assert not sink._records
+    with pytest.raises(OSError):
+        sink.close()
+    assert not sink._thread.is_alive()
+
+
+def test_json_is_imported_only_for_json_output(python):
+    code = (
+        "import sys\n"
+        "from learn_python import http_error, Point, sinks\n"
+        "print('json' in sys.modules)\n"
+        "sinks.StreamSink(format='json').write(sinks.Record(0, 'e', 'm', {}))\n"
+        "print('json' in sys.modules)\n"
+    )
+    lines = python("-c", code).stdout.splitlines()
+    assert lines[0] == "False" and lines[-1] == "True"
@@ -0,0 +1,76 @@
+"""SortedList/SortedSet agree with sorted() and bisect on a plain list."""
+
+import bisect
+import random
+
+import pytest
+
+from learn_python import sorted_collection
+from learn_python.sorted_collection import SortedList, SortedSet
+
+
+@pytest.fixture(autouse=True)
+def tiny_buckets(monkeypatch):
+    # Buckets of 2 (split past 4) exercise splits and empty buckets constantly.
+    monkeypatch.setattr(sorted_collection, "BUCKET_SIZE", 2)
+
+
+@pytest.mark.parametrize("cls", [SortedList, SortedSet])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_sorted_list_randomized(cls, seed):
+    rng = random.Random(seed)
+    values = range(rng.choice((5, 50, 500)))
+    items, model = cls(), []
+
+    def add(item):
+        if cls is SortedList or item not in model:
+            bisect.insort(model, item)
+
+    for _ in range(3_000):
+        op = rng.randrange(6)
+        item = rng.choice(values)
+        if op == 0:
+            items.add(item)
+            add(item)
+        elif op == 1:
+            batch = [rng.choice(values) for _ in range(rng.randrange(6))]
+            items.update(batch)
+            for x in batch:
+                add(x)
+        elif op == 2:
+            if item in model:
+                items.remove(item)
+                model.remove(item)
+            else:
+                with pytest.raises(ValueError):
+                    items.remove(item)
+        elif op == 3:
+            items.discard(item)
+            if item in model:
+                model.remove(item)
+        elif op == 4:
+            assert (item in items) == (item in model)
+            assert items.count(item) == model.count(item)
+            assert items.bisect_left(item) == bisect.bisect_left(model, item)
+            assert items.bisect_right(item) == bisect.bisect_right(model, item)
+        else:
+            low, high = sorted(rng.sample(values, 2)) if len(values) > 1 else (0, 0)
+            inclusive = (rng.random() < 0.5, rng.random() < 0.5)
+            expected = [x for x in model
+                        if (low < x or (inclusive[0] and x == low))
+                        and (x < high or (inclusive[1] and x == high))]
+            assert list(items.irange(low, high, inclusive)) == expected
+        assert len(items) == len(model)
+    assert list(items) == model
+    assert list(reversed(items)) == model[::-1]
+    assert list(items.unique()) == sorted(set(model))
+    assert [items[i] for i in range(-len(model), len(model))] == model + model
+    with pytest.raises(IndexError):
+        items[len(model)]
+
+
+def test_basket_loops():
+    basket = ['apple', 'orange', 'apple', 'pear', 'orange', 'banana']
+    assert list(SortedList(basket)) == sorted(basket)
+    assert list(SortedList(basket).unique()) == sorted(set(basket))
+    assert list(SortedSet(basket)) == sorted(set(basket))
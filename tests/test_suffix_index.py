@@ -0,0 +1,66 @@
+"""SuffixIndex answers like brute-force scans, before and after save/load."""
+
+import random
+
+import pytest
+
+from learn_python.suffix_index import SuffixIndex
+
+
+def _find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1)
+            if text[i:i + len(pattern)] == pattern]
+
+
+def _longest_repeat_length(text):
+    return max((k for k in range(1, len(text))
+                for i in range(len(text) - k + 1)
+                if text.find(text[i:i + k], i + 1) >= 0), default=0)
+
+
+def _check(index, text, patterns):
+    assert len(index) == len(text)
+    for pattern in patterns:
+        positions = _find_all(text, pattern)
+        assert index.find_all(pattern) == positions
+        assert index.count(pattern) == len(positions)
+        assert (pattern in index) == (pattern in text)
+        assert index.find(pattern) == text.find(pattern)
+    repeat = index.longest_repeat()
+    assert len(repeat) == _longest_repeat_length(text)
+    assert not repeat or len(_find_all(text, repeat)) >= 2
+
+
+# Tiny alphabets give long repeats and many equal prefixes; the non-ASCII
+# letters check that the UTF-32 file text still sorts like the str.
+@pytest.mark.parametrize("kind", [str, bytes])
+@pytest.mark.parametrize("alphabet", ["a", "ab", "abc", "aé€𝄞"])
+def test_matches_brute_force_randomized(kind, alphabet, tmp_path):
+    rng = random.Random(alphabet)
+    letters = list(alphabet) if kind is str else [bytes([b]) for b in alphabet.encode()]
+
+    def word(n):
+        return kind().join(rng.choice(letters) for _ in range(n))
+
+    for length in (0, 1, 2, rng.randrange(3, 40), rng.randrange(100, 300)):
+        text = word(length)
+        patterns = [text[i:i + rng.randrange(0, 6)]
+                    for i in (rng.randrange(len(text) + 1) for _ in range(20))]
+        patterns += [word(rng.randrange(1, 5)) for _ in range(20)]
+        index = SuffixIndex(text)
+        _check(index, text, patterns)
+        path = tmp_path / f"{length}.sfx"
+        index.save(path)
+        with SuffixIndex.load(path) as loaded:
+            _check(loaded, text, patterns)
+
+
+def test_rejects_mismatched_types(tmp_path):
+    with pytest.raises(TypeError):
+        SuffixIndex(["not", "text"])
+    with pytest.raises(TypeError):
+        "x" in SuffixIndex(b"bytes")
+    path = tmp_path / "bad.sfx"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SuffixIndex.load(path)
@@ -0,0 +1,80 @@
+"""WorkQueue behaves like a capacity-checked deque, also across threads."""
+
+import random
+import threading
+from collections import deque
+from queue import Empty, Full
+
+import pytest
+
+from learn_python.work_queue import ThreadSafeWorkQueue, WorkQueue
+
+
+@pytest.mark.parametrize("cls", [WorkQueue, ThreadSafeWorkQueue])
+@pytest.mark.parametrize("maxsize", [0, 1, 5])
+def test_matches_deque_randomized(cls, maxsize):
+    rng = random.Random(maxsize)
+    queue, model = cls(maxsize), deque()
+    kwargs = {"block": False} if cls is ThreadSafeWorkQueue else {}
+    for step in range(5_000):
+        op = rng.randrange(4)
+        if op == 0:
+            if 0 < maxsize <= len(model):
+                with pytest.raises(Full):
+                    queue.put(step, **kwargs)
+            else:
+                queue.put(step, **kwargs)
+                model.append(step)
+        elif op == 1:
+            items = list(range(step, step + rng.randrange(4)))
+            taken = queue.put_many(items, **kwargs)
+            if maxsize:
+                assert taken == min(len(items), maxsize - len(model))
+            model.extend(items[:taken])
+        elif op == 2:
+            if model:
+                assert queue.get(**kwargs) == model.popleft()
+            else:
+                with pytest.raises(Empty):
+                    queue.get(**kwargs)
+        elif model or cls is WorkQueue:
+            n = rng.randrange(4)
+            assert queue.get_many(n, **kwargs) == [model.popleft()
+                                                   for _ in range(min(n, len(model)))]
+        assert len(queue) == len(model)
+        assert queue.full() == (0 < maxsize <= len(model))
+
+
+def test_threads_hand_over_every_item_once():
+    queue = ThreadSafeWorkQueue(maxsize=8)
+    got = []
+
+    def consume():
+        while True:
+            batch = queue.get_many(3, timeout=10)
+            if None in batch:
+                got.extend(batch[:batch.index(None)])
+                return
+            got.extend(batch)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    producers = [threading.Thread(target=queue.put_many,
+                                  args=(range(k * 1000, (k + 1) * 1000),))
+                 for k in range(4)]
+    for t in producers:
+        t.start()
+    for t in producers:
+        t.join()
+    queue.put(None)
+    consumer.join()
+    assert sorted(got) == list(range(4000))
+
+
+def test_blocking_get_times_out():
+    with pytest.raises(Empty):
+        ThreadSafeWorkQueue().get(timeout=0.01)
+    queue = ThreadSafeWorkQueue(maxsize=1)
+    queue.put(1)
+    with pytest.raises(Full):
+        queue.put(2, timeout=0.01)